@@ -0,0 +1,42 @@
+"""add_numerology_interpretation_lookup_index
+
+Revision ID: b4e1c7d2a9f3
+Revises: 6f2e5a1342f9
+Create Date: 2025-11-24 10:12:37.204815
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4e1c7d2a9f3'
+down_revision: Union[str, Sequence[str], None] = '6f2e5a1342f9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add covering index for interpretation lookups by type, value and category."""
+    op.create_index(
+        'ix_numerology_interpretation_lookup',
+        'numerology_interpretation',
+        ['number_type', 'number_value', 'category'],
+        postgresql_include=['content'],
+    )
+    # (number_type, number_value) is a leftmost prefix of the new index, so the
+    # old composite index only adds write and storage cost
+    op.drop_index('ix_numerology_interpretation_type_value', table_name='numerology_interpretation')
+
+
+def downgrade() -> None:
+    """Restore the type/value index and remove the interpretation lookup index."""
+    op.create_index(
+        'ix_numerology_interpretation_type_value',
+        'numerology_interpretation',
+        ['number_type', 'number_value'],
+        unique=False
+    )
+    op.drop_index('ix_numerology_interpretation_lookup', table_name='numerology_interpretation')
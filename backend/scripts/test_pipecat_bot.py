@@ -43,6 +43,13 @@ import asyncio
 import sys
 import os
 
+# uvloop ships with uvicorn[standard], so the API server already runs bots on
+# it; use it here too so manual latency checks match production
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Add backend to path for imports
 backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, backend_dir)
@@ -176,10 +183,11 @@ def main():
     """
     Main entry point for test script.
 
-    Runs async test function and returns exit code.
+    Runs async test function (on uvloop when installed) and returns exit code.
     """
     try:
-        exit_code = asyncio.run(test_pipecat_bot())
+        run = uvloop.run if uvloop is not None else asyncio.run
+        exit_code = run(test_pipecat_bot())
         sys.exit(exit_code)
     except Exception as e:
         print(f"\n❌ Fatal error: {e}\n")
@@ -17,7 +17,7 @@ from src.models.user import User
 from src.models.oauth_account import OAuthAccount
 from src.schemas.user import UserCreate, UserLogin, UserResponse, GoogleSignInRequest
 from src.services.oauth_service import (
-    verify_google_token,
+    averify_google_token,
     InvalidTokenError,
     TokenVerificationError,
     get_oauth_provider_user_id,
@@ -396,8 +396,8 @@ async def google_sign_in(
         9. Return user + token
     """
     try:
-        # Verify Google ID token and get user info
-        user_info = verify_google_token(request.id_token)
+        # Verify Google ID token and get user info (off the event loop)
+        user_info = await averify_google_token(request.id_token)
     except InvalidTokenError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -519,7 +519,9 @@ async def end_conversation(
         from src.services.conversation_service import generate_conversation_summary, invalidate_conversation_context_cache
 
         logger.info(f"Generating conversation summary for {conversation_id}")
-        summary = await generate_conversation_summary(conversation_id)
+        # Reuse the request session so the summary read and the update below
+        # share one connection and one transaction
+        summary = await generate_conversation_summary(conversation_id, session=session)
 
         # Populate summary fields
         conversation.main_topic = summary["main_topic"]
@@ -534,7 +536,8 @@ async def end_conversation(
         session.commit()
         session.refresh(conversation)
 
-        # Invalidate cached conversation context for this user
+        # Invalidate cached conversation context for this user (after commit,
+        # so a concurrent cache refill cannot read the pre-summary state)
         await invalidate_conversation_context_cache(current_user.id)
         logger.info(f"Invalidated conversation context cache for user {current_user.id}")
 
@@ -8,13 +8,33 @@ Configuration is centralized in src.core.settings to avoid magic numbers
 and scattered environment variable references.
 """
 
-from typing import Generator
+from typing import Any, Generator
 
+from sqlalchemy.orm import sessionmaker
 from sqlmodel import Session, create_engine
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .settings import settings
 
 
+def _orjson_serializer(value: Any) -> str:
+    """Serialize a JSON column value with orjson (str output, as SQLAlchemy expects)."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# JSON columns (message metadata, conversation context, ...) are encoded with
+# orjson when it is installed - faster than the stdlib json module and it
+# handles UUID/datetime values natively. Falls back to SQLAlchemy's default.
+_json_options = (
+    {"json_serializer": _orjson_serializer, "json_deserializer": orjson.loads}
+    if orjson is not None
+    else {}
+)
+
 # Create SQLModel engine with connection pooling
 # Configuration loaded from settings (environment variables or .env file)
 engine = create_engine(
@@ -24,8 +44,14 @@ engine = create_engine(
     pool_size=settings.db_pool_size,
     max_overflow=settings.db_max_overflow,
     echo_pool=settings.db_echo_pool,
+    **_json_options,
 )
 
+# Preconfigured SQLModel Session factory bound to the shared engine.
+# expire_on_commit=False keeps loaded attributes usable after commit, which
+# suits short read-only lookups outside of FastAPI request scope.
+SessionLocal = sessionmaker(engine, class_=Session, expire_on_commit=False)
+
 
 def get_session() -> Generator[Session, None, None]:
     """
@@ -13,6 +13,7 @@ Configuration is centralized in src.core.settings.
 from typing import Any, Optional
 
 import redis
+import redis.asyncio as aioredis
 from redis import Redis
 from redis.connection import ConnectionPool
 
@@ -24,6 +25,11 @@ from .settings import settings
 redis_pool: Optional[ConnectionPool] = None
 redis_client: Optional[Redis] = None
 
+# Async pool/client for coroutines on the event loop (voice pipeline, async
+# services) so cache round-trips yield instead of blocking the loop
+async_redis_pool: Optional[aioredis.ConnectionPool] = None
+async_redis_client: Optional[aioredis.Redis] = None
+
 
 def get_redis_pool() -> ConnectionPool:
     """
@@ -70,6 +76,53 @@ def get_redis_client() -> Redis:
     return redis_client
 
 
+def get_async_redis_pool() -> aioredis.ConnectionPool:
+    """
+    Get or create the asyncio Redis connection pool.
+
+    Mirrors get_redis_pool() configuration for use with redis.asyncio clients,
+    except that responses are returned as raw bytes so binary (compressed)
+    cache values round-trip intact. Callers decode text values themselves.
+
+    Returns:
+        aioredis.ConnectionPool: Async Redis connection pool instance
+    """
+    global async_redis_pool
+
+    if async_redis_pool is None:
+        async_redis_pool = aioredis.ConnectionPool.from_url(
+            settings.redis_url,
+            max_connections=settings.redis_pool_size,
+            socket_keepalive=settings.redis_socket_keepalive,
+            decode_responses=False,  # Raw bytes - cached values may be compressed
+        )
+
+    return async_redis_pool
+
+
+def get_async_redis_client() -> aioredis.Redis:
+    """
+    Get or create asyncio Redis client instance.
+
+    Use from async code so Redis network round-trips do not block the
+    event loop.
+
+    Returns:
+        aioredis.Redis: Async Redis client instance
+
+    Example:
+        client = get_async_redis_client()
+        await client.set("key", "value")
+        value = await client.get("key")
+    """
+    global async_redis_client
+
+    if async_redis_client is None:
+        async_redis_client = aioredis.Redis(connection_pool=get_async_redis_pool())
+
+    return async_redis_client
+
+
 async def redis_health_check() -> dict:
     """
     Check Redis connection and return health status.
@@ -114,9 +167,30 @@ def dispose_redis_pool() -> None:
         redis_pool = None
 
 
+async def dispose_async_redis_pool() -> None:
+    """
+    Dispose of the asyncio Redis connection pool.
+
+    Async counterpart of dispose_redis_pool(), called from the application
+    lifespan context manager on shutdown.
+    """
+    global async_redis_pool, async_redis_client
+
+    if async_redis_client is not None:
+        await async_redis_client.aclose()
+        async_redis_client = None
+
+    if async_redis_pool is not None:
+        await async_redis_pool.disconnect()
+        async_redis_pool = None
+
+
 __all__ = [
     "get_redis_pool",
     "get_redis_client",
+    "get_async_redis_pool",
+    "get_async_redis_client",
     "redis_health_check",
     "dispose_redis_pool",
+    "dispose_async_redis_pool",
 ]
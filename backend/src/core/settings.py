@@ -180,6 +180,17 @@ class Settings(BaseSettings):
     Environment variable: GOOGLE_ANDROID_CLIENT_ID
     """
 
+    oauth_verify_workers: int = 8
+    """
+    Size of the dedicated thread pool for Google ID token verification.
+
+    Verification does blocking network I/O and RSA signature checks, so async
+    routes run it on this pool instead of the event loop or the default
+    executor shared with database work.
+
+    Environment variable: OAUTH_VERIFY_WORKERS
+    """
+
     # =====================================================================
     # CORS & SECURITY
     # =====================================================================
@@ -386,6 +397,19 @@ class Settings(BaseSettings):
     Environment variable: ELEVENLABS_MODEL
     """
 
+    elevenlabs_http_streaming: bool = False
+    """
+    Use ElevenLabs' HTTP streaming endpoint instead of the WebSocket API for TTS.
+
+    The HTTP variant POSTs each sentence to /v1/text-to-speech/{voice_id}/stream
+    over a keep-alive connection pool shared by all sessions, and streams audio
+    chunks as they arrive. The WebSocket variant (default) keeps one connection
+    open per session and supports word timestamps across the whole reply.
+
+    Environment variable: ELEVENLABS_HTTP_STREAMING
+    Default: False (WebSocket)
+    """
+
     model_config = {
         "env_file": ".env",
         "env_file_encoding": "utf-8",
@@ -29,6 +29,7 @@ async def lifespan(_app: FastAPI):
     Manages:
     - Database (PostgreSQL) connection pool lifecycle
     - Redis connection pool and client lifecycle
+    - Shared voice pipeline HTTP clients (closed on shutdown)
     """
     # Startup event
     from src.core.database import engine
@@ -52,8 +53,13 @@ async def lifespan(_app: FastAPI):
     engine.dispose()
 
     print("✓ Disposing Redis connection pool...")
-    from src.core.redis import dispose_redis_pool
+    from src.core.redis import dispose_redis_pool, dispose_async_redis_pool
     dispose_redis_pool()
+    await dispose_async_redis_pool()
+
+    print("✓ Closing shared voice pipeline clients...")
+    from src.voice_pipeline.pipecat_bot import close_shared_clients
+    await close_shared_clients()
 
     print("✓ Application shutdown complete")
 
@@ -11,6 +11,7 @@ career, relationships, etc.).
 """
 
 from sqlmodel import SQLModel, Field
+from sqlalchemy import Index
 from datetime import datetime
 from uuid import UUID, uuid4
 
@@ -54,6 +55,18 @@ class NumerologyInterpretation(SQLModel, table=True):
 
     __tablename__ = "numerology_interpretation"
 
+    # Covering index for the voice pipeline lookup (type + value [+ category]);
+    # INCLUDE content lets PostgreSQL answer it with an index-only scan
+    __table_args__ = (
+        Index(
+            "ix_numerology_interpretation_lookup",
+            "number_type",
+            "number_value",
+            "category",
+            postgresql_include=["content"],
+        ),
+    )
+
     # Primary key
     id: UUID = Field(
         default_factory=uuid4,
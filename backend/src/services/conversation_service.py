@@ -7,20 +7,61 @@ Provides business logic for conversation management including:
 - Formatting conversation history for AI context
 """
 
+import asyncio
 import logging
 import re
+import zlib
 from typing import List, Dict, Optional
-from uuid import UUID
+from uuid import UUID, uuid4
 from datetime import datetime
 
 from sqlmodel import Session, select
 from src.models.conversation import Conversation
 from src.models.conversation_message import ConversationMessage, MessageRole
 from src.core.database import engine
-from src.core.redis import get_redis_client
+from src.core.redis import get_async_redis_client
 
 logger = logging.getLogger(__name__)
 
+# Conversation context cache settings
+CONTEXT_CACHE_TTL_SECONDS = 1800  # 30 minutes
+CONTEXT_COMPRESSION_LEVEL = 6  # zlib level; context prose compresses ~3x
+CONTEXT_HISTORY_LIMIT = 5
+CONTEXT_MAX_TOKENS = 500
+
+# Format version embedded in the context cache key. Bump it whenever
+# format_conversation_history() output or the parameters above change, so a
+# rollout stops reading entries written by the old format (they expire via TTL).
+_CTX_FMT_VERSION = "v2-5conv-500tok-insightbudget"
+
+# Single-flight lock for cache-miss recomputation. The lock TTL bounds how long
+# a crashed worker can block others; waiters poll the cache for up to
+# CONTEXT_LOCK_POLL_ATTEMPTS * CONTEXT_LOCK_POLL_INTERVAL seconds.
+CONTEXT_LOCK_TTL_SECONDS = 10
+CONTEXT_LOCK_POLL_ATTEMPTS = 20
+CONTEXT_LOCK_POLL_INTERVAL = 0.05
+
+# Deletes the lock only if it still holds our token, so a holder whose lock
+# expired cannot release the lock a later caller has since acquired
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+# Conversation summary heuristics. Topics are checked in priority order:
+# the first topic whose keywords appear anywhere in the transcript wins.
+_SUMMARY_BATCH_SIZE = 100
+_TOPIC_KEYWORDS = {
+    "Life Path Number": ["life path", "số đường đời", "life path number"],
+    "Expression Number": ["expression number", "số biểu hiện", "expression"],
+    "Soul Urge Number": ["soul urge", "số khát khao", "soul"],
+    "Birthday Number": ["birthday number", "sinh nhật", "birthday"],
+    "Personal Year": ["personal year", "năm cá nhân", "this year"]
+}
+_NUMBER_PATTERN = re.compile(r'\b([1-9]|11|22|33)\b')
+
 
 async def get_recent_conversations(user_id: UUID, limit: int = 5) -> List[Dict]:
     """
@@ -111,42 +152,49 @@ async def get_conversation_context_cached(user_id: UUID) -> str:
         Returns empty string if user has no conversations or on error.
 
     Cache Details:
-        - Key format: "context:{user_id}"
+        - Key format: "context:{format_version}:{user_id}"
         - TTL: 1800 seconds (30 minutes)
         - Invalidation: Manual (when new conversation completes)
+        - Encoding: zlib-compressed UTF-8
+        - Stampede protection: concurrent misses for the same user are
+          coalesced via a short-lived "ctx_lock:{user_id}" lock (SET NX),
+          holding a per-caller token and released with compare-and-delete
 
     Example:
         context = await get_conversation_context_cached(user.id)
         # Returns: "Previous conversations with this user:\\n1. Nov 23: Life Path Number..."
     """
     try:
-        redis = get_redis_client()
-        cache_key = f"context:{user_id}"
+        redis = get_async_redis_client()
+        cache_key = _context_cache_key(user_id)
+        lock_key = f"ctx_lock:{user_id}"
+        lock_token = uuid4().hex
 
         # Check cache
-        cached = redis.get(cache_key)
+        cached = await redis.get(cache_key)
         if cached:
             logger.debug(f"Cache hit for user {user_id} conversation context")
-            return cached if isinstance(cached, str) else cached.decode('utf-8')
-
-        # Cache miss - compute from database
-        logger.debug(f"Cache miss for user {user_id} - computing context")
-
-        # Import here to avoid circular dependency
-        from src.voice_pipeline.system_prompts import format_conversation_history
-
-        conversations = await get_recent_conversations(user_id, limit=5)
-        context = format_conversation_history(conversations, max_tokens=500)
-
-        # Store in cache with 30-minute TTL
-        redis.set(cache_key, context, ex=1800)
-
-        logger.info(
-            f"Computed and cached conversation context for user {user_id} "
-            f"({len(conversations)} conversations, {len(context)} chars)"
-        )
-
-        return context
+            return _decompress_context(cached)
+
+        # Cache miss - only one caller recomputes (single-flight), the rest
+        # wait briefly for the winner to populate the cache
+        if not await redis.set(lock_key, lock_token, nx=True, ex=CONTEXT_LOCK_TTL_SECONDS):
+            logger.debug(f"Context recompute in progress for user {user_id} - waiting")
+            for _ in range(CONTEXT_LOCK_POLL_ATTEMPTS):
+                await asyncio.sleep(CONTEXT_LOCK_POLL_INTERVAL)
+                cached = await redis.get(cache_key)
+                if cached:
+                    return _decompress_context(cached)
+
+            # Winner is slow or died - compute without the lock rather than fail
+            logger.debug(f"Timed out waiting for context of user {user_id} - computing")
+            return await _compute_and_cache_context(redis, user_id, cache_key)
+
+        try:
+            logger.debug(f"Cache miss for user {user_id} - computing context")
+            return await _compute_and_cache_context(redis, user_id, cache_key)
+        finally:
+            await redis.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, lock_token)
 
     except Exception as e:
         logger.error(
@@ -157,6 +205,61 @@ async def get_conversation_context_cached(user_id: UUID) -> str:
         return ""
 
 
+def _context_cache_key(user_id: UUID) -> str:
+    """Build the Redis key for a user's cached conversation context."""
+    return f"context:{_CTX_FMT_VERSION}:{user_id}"
+
+
+def _compress_context(context: str) -> bytes:
+    """Compress a context string for storage in Redis."""
+    return zlib.compress(context.encode("utf-8"), CONTEXT_COMPRESSION_LEVEL)
+
+
+def _decompress_context(cached) -> str:
+    """
+    Decode a cached context value.
+
+    Accepts zlib-compressed bytes as written by _compress_context(), and
+    falls back to plain UTF-8 for entries written before compression was
+    introduced (they simply expire with the 30-minute TTL).
+    """
+    if isinstance(cached, str):
+        return cached
+    try:
+        return zlib.decompress(cached).decode("utf-8")
+    except zlib.error:
+        return cached.decode("utf-8")
+
+
+async def _compute_and_cache_context(redis, user_id: UUID, cache_key: str) -> str:
+    """
+    Compute conversation context from the database and store it in Redis.
+
+    Args:
+        redis: Async Redis client used for the cache write
+        user_id: UUID of the user whose context to compute
+        cache_key: Redis key to store the computed context under
+
+    Returns:
+        Formatted conversation history string
+    """
+    # Import here to avoid circular dependency
+    from src.voice_pipeline.system_prompts import format_conversation_history
+
+    conversations = await get_recent_conversations(user_id, limit=CONTEXT_HISTORY_LIMIT)
+    context = format_conversation_history(conversations, max_tokens=CONTEXT_MAX_TOKENS)
+
+    # Store in cache with 30-minute TTL
+    await redis.set(cache_key, _compress_context(context), ex=CONTEXT_CACHE_TTL_SECONDS)
+
+    logger.info(
+        f"Computed and cached conversation context for user {user_id} "
+        f"({len(conversations)} conversations, {len(context)} chars)"
+    )
+
+    return context
+
+
 async def invalidate_conversation_context_cache(user_id: UUID) -> None:
     """
     Invalidate cached conversation context for a user.
@@ -172,9 +275,9 @@ async def invalidate_conversation_context_cache(user_id: UUID) -> None:
         await invalidate_conversation_context_cache(user.id)
     """
     try:
-        redis = get_redis_client()
-        cache_key = f"context:{user_id}"
-        redis.delete(cache_key)
+        redis = get_async_redis_client()
+        cache_key = _context_cache_key(user_id)
+        await redis.delete(cache_key)
         logger.debug(f"Invalidated conversation context cache for user {user_id}")
     except Exception as e:
         logger.warning(
@@ -184,7 +287,10 @@ async def invalidate_conversation_context_cache(user_id: UUID) -> None:
         # Non-critical error - cache will expire naturally
 
 
-async def generate_conversation_summary(conversation_id: UUID) -> Dict[str, Optional[str]]:
+async def generate_conversation_summary(
+    conversation_id: UUID,
+    session: Optional[Session] = None
+) -> Dict[str, Optional[str]]:
     """
     Generate conversation summary by analyzing messages.
 
@@ -192,15 +298,22 @@ async def generate_conversation_summary(conversation_id: UUID) -> Dict[str, Opti
     messages. Uses simple heuristic analysis to identify the primary discussion topic
     and numerology numbers mentioned.
 
+    Only the role and content columns are fetched, in a single query. When a
+    session is passed in, the query runs on it so the caller can save the
+    summary in the same transaction instead of opening a second connection.
+    The read is wrapped in a savepoint, so a failed query rolls back only to
+    the savepoint and the caller's transaction can still be committed.
+
     Args:
         conversation_id: UUID of the conversation to summarize
+        session: Optional existing database session to reuse
 
     Returns:
         Dict with keys: main_topic, key_insights, numbers_discussed
         Returns default values if conversation has no messages or on error
 
     Example:
-        summary = await generate_conversation_summary(conversation.id)
+        summary = await generate_conversation_summary(conversation.id, session=session)
         # Returns: {
         #   "main_topic": "Life Path Number",
         #   "key_insights": "User resonates with leadership qualities of number 1",
@@ -208,69 +321,12 @@ async def generate_conversation_summary(conversation_id: UUID) -> Dict[str, Opti
         # }
     """
     try:
-        with Session(engine) as session:
-            # Query all messages for this conversation
-            statement = (
-                select(ConversationMessage)
-                .where(ConversationMessage.conversation_id == conversation_id)
-                .order_by(ConversationMessage.timestamp.asc())
-            )
-
-            messages = session.exec(statement).all()
-
-            if not messages:
-                logger.info(f"No messages found for conversation {conversation_id}")
-                return {
-                    "main_topic": "General discussion",
-                    "key_insights": None,
-                    "numbers_discussed": None
-                }
-
-            # Extract content from messages
-            user_messages = [msg.content for msg in messages if msg.role == MessageRole.USER]
-            assistant_messages = [msg.content for msg in messages if msg.role == MessageRole.ASSISTANT]
-
-            # Simple heuristic: Find most common numerology topics mentioned
-            all_content = " ".join(user_messages + assistant_messages).lower()
-
-            # Identify main topic based on keywords
-            topic_keywords = {
-                "Life Path Number": ["life path", "số đường đời", "life path number"],
-                "Expression Number": ["expression number", "số biểu hiện", "expression"],
-                "Soul Urge Number": ["soul urge", "số khát khao", "soul"],
-                "Birthday Number": ["birthday number", "sinh nhật", "birthday"],
-                "Personal Year": ["personal year", "năm cá nhân", "this year"]
-            }
-
-            detected_topic = "General numerology discussion"
-            for topic, keywords in topic_keywords.items():
-                if any(keyword in all_content for keyword in keywords):
-                    detected_topic = topic
-                    break
-
-            # Extract numbers mentioned (looking for numerology numbers 1-9, 11, 22, 33)
-            number_pattern = r'\b([1-9]|11|22|33)\b'
-            numbers_found = set(re.findall(number_pattern, all_content))
-            numbers_str = ", ".join(sorted(numbers_found, key=int)) if numbers_found else None
-
-            # Generate key insights from first assistant message (usually contains main insight)
-            key_insight = None
-            if assistant_messages:
-                # Take first substantial assistant message as key insight
-                first_message = assistant_messages[0]
-                # Truncate to 200 chars for database storage
-                key_insight = first_message[:200] if len(first_message) > 200 else first_message
+        if session is not None:
+            with session.begin_nested():
+                return _summarize_conversation(session, conversation_id)
 
-            logger.info(
-                f"Generated summary for conversation {conversation_id}: "
-                f"topic='{detected_topic}', numbers='{numbers_str}'"
-            )
-
-            return {
-                "main_topic": detected_topic,
-                "key_insights": key_insight,
-                "numbers_discussed": numbers_str
-            }
+        with Session(engine) as own_session:
+            return _summarize_conversation(own_session, conversation_id)
 
     except Exception as e:
         logger.error(
@@ -285,6 +341,75 @@ async def generate_conversation_summary(conversation_id: UUID) -> Dict[str, Opti
         }
 
 
+def _summarize_conversation(session: Session, conversation_id: UUID) -> Dict[str, Optional[str]]:
+    """
+    Build the summary dict for a conversation using the given session.
+
+    Args:
+        session: Database session to query messages with
+        conversation_id: UUID of the conversation to summarize
+
+    Returns:
+        Dict with keys: main_topic, key_insights, numbers_discussed
+    """
+    # Stream role/content of all messages for this conversation; yield_per
+    # uses a server-side cursor so long sessions are scanned in batches
+    # rather than materialized in memory all at once
+    statement = (
+        select(ConversationMessage.role, ConversationMessage.content)
+        .where(ConversationMessage.conversation_id == conversation_id)
+        .order_by(ConversationMessage.timestamp.asc())
+        .execution_options(yield_per=_SUMMARY_BATCH_SIZE)
+    )
+
+    matched_topics = set()
+    numbers_found = set()
+    key_insight = None
+    message_count = 0
+
+    for role, content in session.exec(statement):
+        message_count += 1
+        text = content.lower()
+
+        # Identify topics based on keywords (resolved in priority order below)
+        for topic, keywords in _TOPIC_KEYWORDS.items():
+            if topic not in matched_topics and any(keyword in text for keyword in keywords):
+                matched_topics.add(topic)
+
+        # Extract numbers mentioned (looking for numerology numbers 1-9, 11, 22, 33)
+        numbers_found.update(_NUMBER_PATTERN.findall(text))
+
+        # Key insight is the first assistant message (usually contains main insight),
+        # truncated to 200 chars for database storage
+        if key_insight is None and role == MessageRole.ASSISTANT:
+            key_insight = content[:200]
+
+    if not message_count:
+        logger.info(f"No messages found for conversation {conversation_id}")
+        return {
+            "main_topic": "General discussion",
+            "key_insights": None,
+            "numbers_discussed": None
+        }
+
+    detected_topic = next(
+        (topic for topic in _TOPIC_KEYWORDS if topic in matched_topics),
+        "General numerology discussion"
+    )
+    numbers_str = ", ".join(sorted(numbers_found, key=int)) if numbers_found else None
+
+    logger.info(
+        f"Generated summary for conversation {conversation_id}: "
+        f"topic='{detected_topic}', numbers='{numbers_str}'"
+    )
+
+    return {
+        "main_topic": detected_topic,
+        "key_insights": key_insight,
+        "numbers_discussed": numbers_str
+    }
+
+
 __all__ = [
     "get_recent_conversations",
     "get_conversation_context_cached",
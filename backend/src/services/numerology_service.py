@@ -35,13 +35,43 @@ References:
     - PRD FR-2: Numerology Calculation Engine
 """
 
+import logging
 from datetime import date
-from typing import Optional
+from typing import List, Optional, Sequence
+
+# numpy is optional - only used to vectorize bulk (analytics/backfill) calculations
+try:
+    import numpy as np
+except ImportError:
+    np = None
+    logging.debug("numpy not available - batch calculations will use the scalar path")
 
 # Constants
 MASTER_NUMBERS = {11, 22, 33}
 """Set of master numbers that should never be reduced further in numerology calculations"""
 
+_YEAR_DIGIT_SUM = {year: sum(int(digit) for digit in str(year)) for year in range(1900, 2101)}
+"""Precomputed digit sums for years 1900-2100 (covers realistic birth and current years)"""
+
+
+def _year_digit_sum(year: int) -> int:
+    """
+    Return the sum of the digits of a year.
+
+    Uses the precomputed _YEAR_DIGIT_SUM table for common years and falls back
+    to digit summation for years outside that range.
+
+    Args:
+        year: Calendar year
+
+    Returns:
+        Sum of the year's digits (e.g. 1990 → 19)
+    """
+    year_sum = _YEAR_DIGIT_SUM.get(year)
+    if year_sum is None:
+        year_sum = sum(int(digit) for digit in str(year))
+    return year_sum
+
 
 def _reduce_to_single_digit(number: int) -> int:
     """
@@ -106,7 +136,7 @@ def calculate_life_path(birth_date: date) -> int:
     day_reduced = _reduce_to_single_digit(birth_date.day)
 
     # Reduce year component (sum all digits in year first)
-    year_sum = sum(int(digit) for digit in str(birth_date.year))
+    year_sum = _year_digit_sum(birth_date.year)
     year_reduced = _reduce_to_single_digit(year_sum)
 
     # Combine and reduce final sum
@@ -161,6 +191,83 @@ def calculate_expression_number(full_name: str) -> int:
     return _reduce_to_single_digit(total)
 
 
+def calculate_expression_numbers_batch(full_names: Sequence[str]) -> List[int]:
+    """
+    Calculate Expression numbers for many names at once.
+
+    Intended for analytics and backfill jobs that recompute numbers for a
+    large set of users. When numpy is available, ASCII names are packed into a
+    padded byte matrix and summed with a single table lookup; the master-number
+    preserving reduction is then applied element-wise. Without numpy (or for
+    names containing non-ASCII letters) this falls back to
+    calculate_expression_number(), so results are always identical.
+
+    Args:
+        full_names: Sequence of full birth names
+
+    Returns:
+        List of Expression numbers in the same order as full_names
+
+    Example:
+        >>> calculate_expression_numbers_batch(["John Smith", "MARY"])
+        [8, 3]
+    """
+    if np is None or not full_names:
+        return [calculate_expression_number(name) for name in full_names]
+
+    ascii_indices = [i for i, name in enumerate(full_names) if name.isascii()]
+    results = [0] * len(full_names)
+
+    if ascii_indices:
+        encoded = [full_names[i].encode("ascii") for i in ascii_indices]
+        width = max(len(name) for name in encoded) or 1
+        buffer = b"".join(name.ljust(width, b"\0") for name in encoded)
+        matrix = np.frombuffer(buffer, dtype=np.uint8).reshape(len(encoded), width)
+
+        totals = _LETTER_LOOKUP[matrix].sum(axis=1, dtype=np.int64)
+        reduced = _reduce_to_single_digit_array(totals)
+        for index, value in zip(ascii_indices, reduced.tolist()):
+            results[index] = value
+
+    for i, name in enumerate(full_names):
+        if not name.isascii():
+            results[i] = calculate_expression_number(name)
+
+    return results
+
+
+def _reduce_to_single_digit_array(numbers):
+    """
+    Vectorized equivalent of _reduce_to_single_digit() for numpy arrays.
+
+    Args:
+        numbers: numpy integer array of non-negative sums
+
+    Returns:
+        numpy array with each element reduced to 1-9 or a master number
+    """
+    masters = np.array(sorted(MASTER_NUMBERS))
+    numbers = numbers.copy()
+    pending = (numbers > 9) & ~np.isin(numbers, masters)
+    while pending.any():
+        remaining = numbers[pending]
+        digit_sum = np.zeros_like(remaining)
+        while (remaining > 0).any():
+            digit_sum += remaining % 10
+            remaining //= 10
+        numbers[pending] = digit_sum
+        pending = (numbers > 9) & ~np.isin(numbers, masters)
+    return numbers
+
+
+# Byte-indexed letter values for the vectorized batch path (non-letters map to 0)
+if np is not None:
+    _LETTER_LOOKUP = np.zeros(256, dtype=np.int64)
+    for _letter, _value in _LETTER_VALUES.items():
+        _LETTER_LOOKUP[ord(_letter)] = _value
+        _LETTER_LOOKUP[ord(_letter.lower())] = _value
+
+
 # Vowels for Soul Urge calculation (Y is considered a vowel in certain positions)
 _VOWELS = {'A', 'E', 'I', 'O', 'U'}
 
@@ -257,7 +364,7 @@ def calculate_personal_year(birth_date: date, current_year: Optional[int] = None
     day_reduced = _reduce_to_single_digit(birth_date.day)
 
     # Reduce current year component
-    year_sum = sum(int(digit) for digit in str(current_year))
+    year_sum = _year_digit_sum(current_year)
     year_reduced = _reduce_to_single_digit(year_sum)
 
     # Combine and reduce final sum
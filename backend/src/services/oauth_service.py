@@ -5,15 +5,63 @@ Provides services for verifying OAuth tokens from providers like Google,
 and managing OAuth account linking and authentication.
 """
 
+import asyncio
+import base64
+import binascii
+import hashlib
+import json
 import logging
-from typing import Dict, Any, Optional
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Tuple
+import requests
 from google.auth.transport import requests as google_requests
 from google.oauth2 import id_token
+from requests.adapters import HTTPAdapter
 from src.core.settings import settings
 
 logger = logging.getLogger(__name__)
 
 
+def _build_google_request() -> google_requests.Request:
+    """
+    Build the shared transport used to fetch Google's public signing certs.
+
+    The underlying requests.Session keeps HTTPS connections alive between
+    verifications, so the certs fetch does not pay a TLS handshake each time.
+    requests.Session is safe for the concurrent GETs made by worker threads.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+    session.mount("https://", adapter)
+    return google_requests.Request(session=session)
+
+
+# Shared across calls (a fresh Request per call meant a new session and TLS handshake)
+_GOOGLE_REQUEST = _build_google_request()
+
+# Base64url segment pattern for the structural JWT pre-check
+_JWT_SEGMENT_RE = re.compile(r'^[A-Za-z0-9_-]+$')
+
+# Dedicated pool for blocking verification so token checks (including abusive
+# ones) cannot starve the event loop or the default executor used for DB work
+_OAUTH_EXECUTOR = ThreadPoolExecutor(
+    max_workers=settings.oauth_verify_workers or 8,
+    thread_name_prefix="oauth-verify",
+)
+
+# In-process cache of verified tokens: blake2b(token) -> (expires_at, user_info)
+# Entries live until the token's own exp, capped at _TOKEN_CACHE_TTL_SECONDS.
+# Only successful verifications are cached.
+_TOKEN_CACHE_MAXSIZE = 4096
+_TOKEN_CACHE_TTL_SECONDS = 300
+_token_cache: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_token_cache_lock = threading.Lock()
+
+
 class OAuthServiceError(Exception):
     """Base exception for OAuth service errors."""
     pass
@@ -29,6 +77,88 @@ class TokenVerificationError(OAuthServiceError):
     pass
 
 
+def _looks_like_jwt(token: str) -> bool:
+    """
+    Cheap structural check that a string could be a Google-signed ID token.
+
+    Rejects obvious garbage before any JWKS lookup or RSA verification:
+    the token must have three base64url segments and a JSON header with
+    alg RS256 and a string kid. This does not validate anything a forger
+    could not produce - signature verification still decides validity.
+
+    Args:
+        token: Raw ID token string
+
+    Returns:
+        True if the token is structurally a RS256 JWT, False otherwise
+    """
+    if token.count('.') != 2:
+        return False
+
+    header, payload, signature = token.split('.')
+    if not all(_JWT_SEGMENT_RE.match(segment) for segment in (header, payload, signature)):
+        return False
+
+    try:
+        header_json = json.loads(base64.urlsafe_b64decode(header + '=' * (-len(header) % 4)))
+    except (binascii.Error, ValueError):
+        return False
+
+    return (
+        isinstance(header_json, dict)
+        and header_json.get('alg') == 'RS256'
+        and isinstance(header_json.get('kid'), str)
+    )
+
+
+def _token_cache_key(id_token_str: str) -> bytes:
+    """Hash the raw token so cache memory per entry stays bounded."""
+    return hashlib.blake2b(id_token_str.encode(), digest_size=16).digest()
+
+
+def _get_cached_token(key: bytes) -> Optional[Dict[str, Any]]:
+    """Return cached user info for a token hash if present and not expired."""
+    with _token_cache_lock:
+        entry = _token_cache.get(key)
+        if entry is None:
+            return None
+
+        expires_at, user_info = entry
+        if expires_at <= time.time():
+            del _token_cache[key]
+            return None
+
+        _token_cache.move_to_end(key)
+        return dict(user_info)
+
+
+def _cache_token(key: bytes, user_info: Dict[str, Any], exp: Optional[float]) -> None:
+    """Cache verified user info until min(token exp, cache TTL)."""
+    now = time.time()
+    ttl = _TOKEN_CACHE_TTL_SECONDS
+    if exp is not None:
+        ttl = min(exp - now, ttl)
+    if ttl <= 0:
+        return
+
+    with _token_cache_lock:
+        _token_cache[key] = (now + ttl, dict(user_info))
+        _token_cache.move_to_end(key)
+        while len(_token_cache) > _TOKEN_CACHE_MAXSIZE:
+            _token_cache.popitem(last=False)
+
+
+def clear_token_cache() -> None:
+    """
+    Clear the in-process cache of verified Google tokens.
+
+    Call after rotating the OAuth client ID or when cached verifications
+    must not be trusted any more.
+    """
+    with _token_cache_lock:
+        _token_cache.clear()
+
+
 def verify_google_token(id_token_str: str) -> Dict[str, Any]:
     """
     Verify a Google OAuth ID token and return user information.
@@ -38,6 +168,10 @@ def verify_google_token(id_token_str: str) -> Dict[str, Any]:
     - Token is not expired
     - Token audience matches our client ID
 
+    Successful verifications are cached in-process (keyed by a hash of the
+    token) until the token expires or for at most 5 minutes, so repeated
+    sign-ins with the same token skip the signature check.
+
     Args:
         id_token_str: Google ID token string (JWT) from frontend
 
@@ -68,10 +202,20 @@ def verify_google_token(id_token_str: str) -> Dict[str, Any]:
     if not id_token_str:
         raise InvalidTokenError("ID token is required")
 
+    if not _looks_like_jwt(id_token_str):
+        logger.warning("Rejected malformed Google token before verification")
+        raise InvalidTokenError("Invalid Google token: malformed JWT")
+
     if not settings.google_web_client_id:
         logger.error("GOOGLE_WEB_CLIENT_ID not configured")
         raise TokenVerificationError("Google OAuth not configured on server")
 
+    cache_key = _token_cache_key(id_token_str)
+    cached = _get_cached_token(cache_key)
+    if cached is not None:
+        logger.debug(f"Google token cache hit for user {cached.get('email')}")
+        return cached
+
     try:
         # Verify token signature and get claims
         # Using google.oauth2.id_token.verify_oauth2_token
@@ -81,7 +225,7 @@ def verify_google_token(id_token_str: str) -> Dict[str, Any]:
         # - Token audience (client ID)
         idinfo = id_token.verify_oauth2_token(
             id_token_str,
-            google_requests.Request(),
+            _GOOGLE_REQUEST,
             cid=settings.google_web_client_id,
         )
 
@@ -89,13 +233,15 @@ def verify_google_token(id_token_str: str) -> Dict[str, Any]:
         logger.info(f"Google token verified for user {idinfo.get('email')}")
 
         # Return essential user info from token claims
-        return {
+        user_info = {
             'sub': idinfo['sub'],  # Google's unique user ID
             'email': idinfo.get('email', ''),
             'name': idinfo.get('name', ''),
             'picture': idinfo.get('picture', ''),
             'email_verified': idinfo.get('email_verified', False),
         }
+        _cache_token(cache_key, user_info, idinfo.get('exp'))
+        return user_info
 
     except ValueError as e:
         # ValueError raised by google.oauth2.id_token.verify_oauth2_token
@@ -116,6 +262,30 @@ def verify_google_token(id_token_str: str) -> Dict[str, Any]:
         raise TokenVerificationError(f"Token verification failed: {str(e)}")
 
 
+async def averify_google_token(id_token_str: str) -> Dict[str, Any]:
+    """
+    Async wrapper for verify_google_token().
+
+    Runs verification on a dedicated bounded thread pool so async route
+    handlers do not block the event loop on network I/O or RSA checks.
+
+    Args:
+        id_token_str: Google ID token string (JWT) from frontend
+
+    Returns:
+        Dictionary containing user info (see verify_google_token)
+
+    Raises:
+        InvalidTokenError: If token is invalid, expired, or malformed
+        TokenVerificationError: If Google API verification fails
+
+    Example:
+        user_info = await averify_google_token(request.id_token)
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_OAUTH_EXECUTOR, verify_google_token, id_token_str)
+
+
 def get_oauth_provider_user_id(user_info: Dict[str, Any]) -> str:
     """
     Extract OAuth provider's unique user ID from verified user info.
@@ -146,6 +316,8 @@ def get_oauth_user_email(user_info: Dict[str, Any]) -> str:
 
 __all__ = [
     "verify_google_token",
+    "averify_google_token",
+    "clear_token_cache",
     "get_oauth_provider_user_id",
     "get_oauth_user_email",
     "OAuthServiceError",
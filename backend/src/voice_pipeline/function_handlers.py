@@ -35,6 +35,9 @@ llm.register_function("calculate_soul_urge_number", handle_calculate_soul_urge)
 llm.register_function("get_numerology_interpretation", handle_get_interpretation)
 ```
 
+Alternatively, handle_numerology_function routes any of the above by name through
+a precomputed dispatch table and validates required arguments.
+
 Return Pattern:
 -------------
 Results are returned via the async callback:
@@ -50,10 +53,13 @@ References:
 - Story 4.2: NumerologyInterpretation model - Database schema
 """
 
-from datetime import datetime
+import asyncio
+from datetime import date
+from functools import lru_cache
+from typing import Tuple
 import logging
 
-from sqlmodel import Session, select
+from sqlmodel import select
 from pipecat.services.llm_service import FunctionCallParams, FunctionCallResultProperties
 
 from src.services.numerology_service import (
@@ -62,12 +68,79 @@ from src.services.numerology_service import (
     calculate_soul_urge_number
 )
 from src.models.numerology_interpretation import NumerologyInterpretation
-from src.core.database import engine
+from src.core.database import SessionLocal
 
 # Set up logger for this module
 logger = logging.getLogger(__name__)
 
 
+# Memoized numerology calculations. The service functions are pure, and the LLM
+# tends to send the same name/date repeatedly within a session. Names are
+# normalized (strip + lower) before lookup; the calculations already ignore
+# case and surrounding whitespace, so this only raises the hit rate.
+_life_path_cached = lru_cache(maxsize=512)(calculate_life_path)
+_expression_cached = lru_cache(maxsize=512)(calculate_expression_number)
+_soul_urge_cached = lru_cache(maxsize=512)(calculate_soul_urge_number)
+
+# Valid interpretation lookups (mirrors the get_numerology_interpretation schema
+# enums). Anything else has no rows, so it is answered without touching the DB.
+_VALID_NUMBER_TYPES = frozenset({"life_path", "expression", "soul_urge", "birthday", "personal_year"})
+_VALID_NUMBER_VALUES = frozenset({1, 2, 3, 4, 5, 6, 7, 8, 9, 11, 22, 33})
+
+# Names longer than this are computed in a worker thread. Real names are far
+# shorter and compute in microseconds - cheaper inline than a thread hop - but
+# an unusually long string from the LLM should not stall audio frame dispatch.
+_THREAD_OFFLOAD_NAME_LENGTH = 256
+
+
+async def _calculate_from_name(calculate, full_name: str) -> int:
+    """
+    Run a name-based numerology calculation without blocking the event loop.
+
+    Args:
+        calculate: Pure numerology function taking a full name
+        full_name: Full name argument from the LLM
+
+    Returns:
+        Calculated numerology number
+    """
+    if len(full_name) > _THREAD_OFFLOAD_NAME_LENGTH:
+        return await asyncio.to_thread(calculate, full_name)
+    return calculate(full_name)
+
+
+@lru_cache(maxsize=256)
+def _parse_birth_date(birth_date: str) -> date:
+    """
+    Parse a YYYY-MM-DD birth date string.
+
+    Slices the fixed-width ISO format directly instead of going through
+    datetime.strptime(), which is several times slower on this hot path.
+    Results are memoized per raw string since the LLM re-sends the same
+    birth date across calls; invalid input raises and is not cached.
+
+    Args:
+        birth_date: Date string in YYYY-MM-DD format
+
+    Returns:
+        Parsed date object
+
+    Raises:
+        ValueError: If the string is not YYYY-MM-DD or is not a real date
+    """
+    year, month, day = birth_date[0:4], birth_date[5:7], birth_date[8:10]
+    if (
+        len(birth_date) != 10
+        or birth_date[4] != '-'
+        or birth_date[7] != '-'
+        or not (year.isdigit() and month.isdigit() and day.isdigit())
+    ):
+        raise ValueError(f"Invalid date format: {birth_date!r}")
+
+    # date() raises ValueError for out-of-range months/days
+    return date(int(year), int(month), int(day))
+
+
 async def handle_calculate_life_path(params: FunctionCallParams):
     """
     Handle LLM function call for Life Path number calculation.
@@ -89,28 +162,32 @@ async def handle_calculate_life_path(params: FunctionCallParams):
     """
     try:
         birth_date = params.arguments.get("birth_date")
-        logger.info(f"Calculating Life Path number for birth date: {birth_date}")
+        logger.info("Calculating Life Path number for birth date: %s", birth_date)
 
         # Convert string to date object
-        parsed_date = datetime.strptime(birth_date, "%Y-%m-%d").date()
+        parsed_date = _parse_birth_date(birth_date)
 
         # Call service function
-        result = calculate_life_path(parsed_date)
+        result = _life_path_cached(parsed_date)
+
+        logger.info("Successfully calculated Life Path number: %s", result)
 
-        logger.info(f"Successfully calculated Life Path number: {result}")
+        # The LLM usually asks for the interpretation next - start loading it now
+        _prefetch_interpretations(params, "life_path", result)
 
         # Tell Pipecat to run the LLM after this function result
         properties = FunctionCallResultProperties(run_llm=True)
         await params.result_callback({"life_path_number": result}, properties=properties)
 
     except ValueError as e:
-        logger.error(f"Invalid date format: {birth_date}", exc_info=True)
+        # Expected bad input from the LLM - no traceback needed
+        logger.warning("Invalid date format: %s (%s)", birth_date, e)
         await params.result_callback({
             "error": "InvalidDate",
             "message": "Invalid date format. Please use YYYY-MM-DD (e.g., 1990-05-15)"
         })
     except Exception as e:
-        logger.error(f"Unexpected error in handle_calculate_life_path", exc_info=True)
+        logger.error("Unexpected error in handle_calculate_life_path", exc_info=True)
         await params.result_callback({
             "error": "CalculationError",
             "message": "Unable to calculate Life Path number. Please try again."
@@ -138,7 +215,7 @@ async def handle_calculate_expression(params: FunctionCallParams):
     """
     try:
         full_name = params.arguments.get("full_name")
-        logger.info(f"Calculating Expression number for name")
+        logger.info("Calculating Expression number for name")
 
         # Validate name is non-empty
         if not full_name or not full_name.strip():
@@ -150,16 +227,19 @@ async def handle_calculate_expression(params: FunctionCallParams):
             return
 
         # Call service function
-        result = calculate_expression_number(full_name)
+        result = await _calculate_from_name(_expression_cached, full_name.strip().lower())
 
-        logger.info(f"Successfully calculated Expression number: {result}")
+        logger.info("Successfully calculated Expression number: %s", result)
+
+        # The LLM usually asks for the interpretation next - start loading it now
+        _prefetch_interpretations(params, "expression", result)
 
         # Tell Pipecat to run the LLM after this function result
         properties = FunctionCallResultProperties(run_llm=True)
         await params.result_callback({"expression_number": result}, properties=properties)
 
     except Exception as e:
-        logger.error(f"Error in handle_calculate_expression", exc_info=True)
+        logger.error("Error in handle_calculate_expression", exc_info=True)
         await params.result_callback({
             "error": "CalculationError",
             "message": "Unable to calculate Expression number. Please try again."
@@ -187,7 +267,7 @@ async def handle_calculate_soul_urge(params: FunctionCallParams):
     """
     try:
         full_name = params.arguments.get("full_name")
-        logger.info(f"Calculating Soul Urge number for name")
+        logger.info("Calculating Soul Urge number for name")
 
         # Validate name is non-empty
         if not full_name or not full_name.strip():
@@ -199,22 +279,113 @@ async def handle_calculate_soul_urge(params: FunctionCallParams):
             return
 
         # Call service function
-        result = calculate_soul_urge_number(full_name)
+        result = await _calculate_from_name(_soul_urge_cached, full_name.strip().lower())
+
+        logger.info("Successfully calculated Soul Urge number: %s", result)
 
-        logger.info(f"Successfully calculated Soul Urge number: {result}")
+        # The LLM usually asks for the interpretation next - start loading it now
+        _prefetch_interpretations(params, "soul_urge", result)
 
         # Tell Pipecat to run the LLM after this function result
         properties = FunctionCallResultProperties(run_llm=True)
         await params.result_callback({"soul_urge_number": result}, properties=properties)
 
     except Exception as e:
-        logger.error(f"Error in handle_calculate_soul_urge", exc_info=True)
+        logger.error("Error in handle_calculate_soul_urge", exc_info=True)
         await params.result_callback({
             "error": "CalculationError",
             "message": "Unable to calculate Soul Urge number. Please try again."
         })
 
 
+@lru_cache(maxsize=128)
+def _load_interpretations(number_type: str, number_value: int) -> Tuple[Tuple[str, str], ...]:
+    """
+    Load all interpretations for a number from the database, memoized in-process.
+
+    Interpretations are seeded reference data that rarely change, so results
+    are cached per (number_type, number_value). All categories are loaded in
+    one query (a handful of rows per number) and category filtering happens
+    in memory, so a single cache entry - and a single prefetch - serves every
+    category the LLM may ask for. Errors are not cached (lru_cache does not
+    store raised exceptions).
+
+    Args:
+        number_type: Number type (e.g. "life_path")
+        number_value: Number value (1-9, 11, 22, 33)
+
+    Returns:
+        Immutable tuple of (category, content) pairs
+    """
+    with SessionLocal() as session:
+        # Project only the columns returned to the LLM instead of hydrating
+        # full ORM instances
+        query = select(
+            NumerologyInterpretation.category,
+            NumerologyInterpretation.content
+        ).where(
+            NumerologyInterpretation.number_type == number_type,
+            NumerologyInterpretation.number_value == number_value
+        )
+
+        rows = session.exec(query).all()
+
+        return tuple((row_category, content) for row_category, content in rows)
+
+
+# Strong references to in-flight prefetch tasks (the event loop only keeps
+# weak ones, so an unreferenced task could be garbage collected mid-run).
+_prefetch_tasks: set = set()
+
+
+def _on_prefetch_done(task: asyncio.Task) -> None:
+    """Release a finished prefetch task and log (but swallow) its failure."""
+    _prefetch_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.debug("Interpretation prefetch failed: %s", task.exception())
+
+
+def _prefetch_interpretations(params, number_type: str, number_value: int) -> None:
+    """
+    Start loading interpretations for a just-calculated number in the background.
+
+    After a calculation the LLM almost always follows up with
+    get_numerology_interpretation for the same number. Warming the cache while
+    the LLM is still generating that follow-up call overlaps the database
+    round trip with LLM decoding, so the interpretation handler is usually
+    answered from memory.
+
+    Skipped when the caller sets params.prefetch_interpretations to False
+    (the sync shim): its event loop ends with the call, so the result would
+    be thrown away after asyncio.run() waited for the query.
+
+    Args:
+        params: The handler's FunctionCallParams (or stand-in)
+        number_type: Number type matching the calculation (e.g. "life_path")
+        number_value: Calculated number
+    """
+    if not getattr(params, "prefetch_interpretations", True):
+        return
+    if number_value not in _VALID_NUMBER_VALUES:
+        return
+
+    task = asyncio.create_task(
+        asyncio.to_thread(_load_interpretations, number_type, number_value)
+    )
+    _prefetch_tasks.add(task)
+    task.add_done_callback(_on_prefetch_done)
+
+
+def clear_interpretation_cache() -> None:
+    """
+    Clear memoized interpretations.
+
+    Call after editing NumerologyInterpretation rows in a running process so
+    voice sessions pick up the new content.
+    """
+    _load_interpretations.cache_clear()
+
+
 async def handle_get_interpretation(params: FunctionCallParams):
     """
     Handle LLM function call for retrieving numerology interpretations.
@@ -247,38 +418,142 @@ async def handle_get_interpretation(params: FunctionCallParams):
         number_value = params.arguments.get("number_value")
         category = params.arguments.get("category")  # Optional
 
-        logger.info(f"Retrieving interpretations for {number_type} {number_value}" +
-                   (f" (category: {category})" if category else ""))
+        logger.info(
+            "Retrieving interpretations for %s %s (category=%s)",
+            number_type, number_value, category
+        )
 
-        with Session(engine) as session:
-            # Build query with required filters
-            query = select(NumerologyInterpretation).where(
-                NumerologyInterpretation.number_type == number_type,
-                NumerologyInterpretation.number_value == number_value
-            )
+        # The LLM sometimes sends numbers as strings ("7")
+        if isinstance(number_value, str) and number_value.isdigit():
+            number_value = int(number_value)
 
-            # Add optional category filter
-            if category:
-                query = query.where(NumerologyInterpretation.category == category)
+        # Hallucinated types/values (e.g. "destiny", 0) cannot match any row
+        if number_type not in _VALID_NUMBER_TYPES or number_value not in _VALID_NUMBER_VALUES:
+            logger.info("No interpretations for unsupported lookup: %s %s", number_type, number_value)
+            properties = FunctionCallResultProperties(run_llm=True)
+            await params.result_callback({"interpretations": []}, properties=properties)
+            return
 
-            # Execute query
-            results = session.exec(query).all()
+        # Interpretations are read-mostly reference data - served from cache after first lookup.
+        # The database driver is synchronous, so run the lookup in a worker thread to keep
+        # the Pipecat event loop free to process audio frames.
+        rows = await asyncio.to_thread(_load_interpretations, number_type, number_value)
 
-            # Convert to LLM-friendly format
-            interpretations = [
-                {"category": interp.category, "content": interp.content}
-                for interp in results
-            ]
+        # Convert to LLM-friendly format, applying the optional category filter
+        interpretations = [
+            {"category": row_category, "content": content}
+            for row_category, content in rows
+            if not category or row_category == category
+        ]
 
-            logger.info(f"Retrieved {len(interpretations)} interpretation(s)")
+        logger.info("Retrieved %d interpretation(s)", len(interpretations))
 
-            # Tell Pipecat to run the LLM after this function result
-            properties = FunctionCallResultProperties(run_llm=True)
-            await params.result_callback({"interpretations": interpretations}, properties=properties)
+        # Tell Pipecat to run the LLM after this function result
+        properties = FunctionCallResultProperties(run_llm=True)
+        await params.result_callback({"interpretations": interpretations}, properties=properties)
 
     except Exception as e:
-        logger.error(f"Database error in handle_get_interpretation", exc_info=True)
+        logger.error("Database error in handle_get_interpretation", exc_info=True)
         await params.result_callback({
             "error": "DatabaseError",
             "message": "Unable to retrieve interpretations. Please try again."
         })
+
+
+# Function name → (handler, required argument names). Built once at import so
+# routing a function call is a single dict lookup.
+_DISPATCH = {
+    "calculate_life_path": (handle_calculate_life_path, ("birth_date",)),
+    "calculate_expression_number": (handle_calculate_expression, ("full_name",)),
+    "calculate_soul_urge_number": (handle_calculate_soul_urge, ("full_name",)),
+    "get_numerology_interpretation": (handle_get_interpretation, ("number_type", "number_value")),
+}
+
+
+async def handle_numerology_function(params: FunctionCallParams):
+    """
+    Route an LLM function call to the matching numerology handler.
+
+    Can be registered as a single catch-all handler. Looks up the handler by
+    params.function_name and validates required arguments before dispatching.
+
+    Args:
+        params: FunctionCallParams containing:
+            - function_name: Name of the function the LLM called
+            - arguments: Function arguments dict
+            - result_callback: Async function to return results
+
+    Returns:
+        Via callback: the handler's result, or {"error": str, "message": str}
+        with error "UnknownFunction" or "MissingArgument"
+
+    Example:
+        llm.register_function(None, handle_numerology_function)
+    """
+    function_name = params.function_name
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Routing numerology function call: %s with arguments: %s", function_name, params.arguments)
+
+    try:
+        handler, required_args = _DISPATCH[function_name]
+    except KeyError:
+        logger.warning("Unknown numerology function requested: %s", function_name)
+        await params.result_callback({
+            "error": "UnknownFunction",
+            "message": f"Unknown function: {function_name}"
+        })
+        return
+
+    arguments = params.arguments or {}
+    missing = [name for name in required_args if name not in arguments]
+    if missing:
+        logger.warning("Missing argument(s) for %s: %s", function_name, missing)
+        await params.result_callback({
+            "error": "MissingArgument",
+            "message": f"Missing required argument: {', '.join(missing)}"
+        })
+        return
+
+    await handler(params)
+
+
+class _SyncCallParams:
+    """Minimal stand-in for FunctionCallParams that captures the handler result."""
+
+    # No long-lived event loop to keep a prefetched cache warm for
+    prefetch_interpretations = False
+
+    def __init__(self, function_name: str, arguments: dict):
+        self.function_name = function_name
+        self.arguments = arguments
+        self.result = None
+
+    async def result_callback(self, result, properties=None):
+        self.result = result
+
+
+def handle_numerology_function_sync(function_name: str, arguments: dict) -> dict:
+    """
+    Synchronous entry point for callers outside the voice pipeline.
+
+    Runs the async handlers through handle_numerology_function() on a fresh
+    event loop and returns the dict they pass to result_callback, so there is
+    a single implementation of every handler. Must not be called from a
+    running event loop (await handle_numerology_function() there instead).
+
+    Args:
+        function_name: Name of the numerology function to call
+        arguments: Function arguments dict
+
+    Returns:
+        Handler result dict, or {"error": str, "message": str}
+
+    Example:
+        result = handle_numerology_function_sync(
+            "calculate_life_path", {"birth_date": "1990-05-15"}
+        )
+        # Returns: {"life_path_number": 3}
+    """
+    params = _SyncCallParams(function_name, arguments)
+    asyncio.run(handle_numerology_function(params))
+    return params.result
@@ -165,18 +165,26 @@ get_numerology_interpretation_function = FunctionSchema(
     required=["number_type", "number_value"]
 )
 
-# Create ToolsSchema with all numerology functions (for LLM service registration)
-numerology_tools_schema = ToolsSchema(standard_tools=[
+# Single source of truth for the tool set: both exported formats below are derived
+# from this tuple, so adding a function only requires listing it here once.
+_NUMEROLOGY_FUNCTIONS = (
     calculate_life_path_function,
     calculate_expression_number_function,
     calculate_soul_urge_number_function,
-    get_numerology_interpretation_function
-])
+    get_numerology_interpretation_function,
+)
+
+# Create ToolsSchema with all numerology functions (for LLM service registration)
+numerology_tools_schema = ToolsSchema(standard_tools=list(_NUMEROLOGY_FUNCTIONS))
 
 # Convert FunctionSchema objects to OpenAI JSON format for OpenAILLMContext
 # OpenAI expects: [{"type": "function", "function": {"name": ..., "description": ..., "parameters": ...}}]
 def _function_schema_to_openai_format(func_schema: FunctionSchema) -> dict:
-    """Convert Pipecat FunctionSchema to OpenAI JSON format."""
+    """Convert Pipecat FunctionSchema to OpenAI JSON format.
+
+    The properties dict and required list are shared with the FunctionSchema
+    rather than copied, so each tool definition is held in memory only once.
+    """
     return {
         "type": "function",
         "function": {
@@ -192,8 +200,6 @@ def _function_schema_to_openai_format(func_schema: FunctionSchema) -> dict:
 
 # Export tools in OpenAI JSON format for OpenAILLMContext
 numerology_tools = [
-    _function_schema_to_openai_format(calculate_life_path_function),
-    _function_schema_to_openai_format(calculate_expression_number_function),
-    _function_schema_to_openai_format(calculate_soul_urge_number_function),
-    _function_schema_to_openai_format(get_numerology_interpretation_function),
+    _function_schema_to_openai_format(func_schema)
+    for func_schema in _NUMEROLOGY_FUNCTIONS
 ]
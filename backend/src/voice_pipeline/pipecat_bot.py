@@ -46,10 +46,18 @@ References:
 
 import logging
 import asyncio
-from typing import Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import List, Optional, Tuple
 from uuid import UUID
 from datetime import datetime, timezone
 
+import aiohttp
+from openai import AsyncAzureOpenAI
+from sqlalchemy import insert
+
 # Pipecat core components
 from pipecat.pipeline.pipeline import Pipeline
 from pipecat.pipeline.task import PipelineParams, PipelineTask
@@ -64,18 +72,29 @@ from pipecat.audio.vad.silero import SileroVADAnalyzer
 # Speech services
 from pipecat.services.azure.stt import AzureSTTService
 from pipecat.services.azure.llm import AzureLLMService
-from pipecat.services.elevenlabs.tts import ElevenLabsTTSService
+from pipecat.services.elevenlabs.tts import ElevenLabsHttpTTSService, ElevenLabsTTSService
 from pipecat.transcriptions.language import Language
 
 # Message aggregators for conversation history
 from pipecat.processors.aggregators.openai_llm_context import OpenAILLMContext
+from pipecat.processors.transcript_processor import TranscriptProcessor
 
 # Application settings and models
 from src.core.settings import settings
 from src.models.user import User
 from src.models.conversation_message import ConversationMessage, MessageRole
-from src.core.database import engine
-from sqlmodel import Session
+from src.core.database import SessionLocal
+
+# Voice pipeline building blocks - imported at module load so the first
+# session does not pay their import cost after the user has joined the room
+from src.voice_pipeline.function_handlers import (
+    handle_calculate_life_path,
+    handle_calculate_expression,
+    handle_calculate_soul_urge,
+    handle_get_interpretation
+)
+from src.voice_pipeline.numerology_functions import numerology_tools
+from src.voice_pipeline.system_prompts import get_numerology_system_prompt
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -91,65 +110,455 @@ class PipecatBotError(Exception):
     pass
 
 
-async def _save_message_async(
-    conversation_id: UUID,
-    role: MessageRole,
-    content: str,
-    metadata: Optional[dict] = None
-) -> None:
+class ConfigurationError(ValueError):
+    """
+    Raised by _validate_configuration() when required API keys are missing.
+
+    Subclasses ValueError so existing callers keep working, while run_bot can
+    tell it apart from ValueErrors raised inside the pipeline itself.
+    """
+    pass
+
+
+# Required settings and the help shown when each is missing, checked in order
+# by _validate_configuration(). Constant, so it is built once at import.
+_API_KEY_HELP: tuple[tuple[str, str], ...] = (
+    (
+        "azure_speech_api_key",
+        "AZURE_SPEECH_API_KEY (speech-to-text)\n"
+        "  Get from: https://portal.azure.com/ → Speech Services → Keys and Endpoint",
+    ),
+    (
+        "azure_openai_api_key",
+        "AZURE_OPENAI_API_KEY (language model)\n"
+        "  Get from: https://portal.azure.com/ → Azure OpenAI Service → Keys",
+    ),
+    (
+        "azure_openai_endpoint",
+        "AZURE_OPENAI_ENDPOINT (Azure endpoint URL)\n"
+        "  Get from: https://portal.azure.com/ → Azure OpenAI Service → Endpoint",
+    ),
+    (
+        "elevenlabs_api_key",
+        "ELEVENLABS_API_KEY (text-to-speech)\n"
+        "  Get from: https://elevenlabs.io/ → Profile → API Keys",
+    ),
+)
+
+_MISSING_KEYS_MESSAGE = (
+    "Voice pipeline API keys not configured. "
+    "Set the following environment variables in .env file:\n\n"
+    "{}"
+    "\n\nSee backend/.env.example for setup instructions."
+)
+
+
+# Set after the first successful _validate_configuration() call
+_config_validated = False
+
+# Numerology tool name → handler, registered with the LLM service per session.
+# Adding a tool only needs a new row here (plus its schema in numerology_functions).
+_FUNCTION_HANDLERS = (
+    ("calculate_life_path", handle_calculate_life_path),
+    ("calculate_expression_number", handle_calculate_expression),
+    ("calculate_soul_urge_number", handle_calculate_soul_urge),
+    ("get_numerology_interpretation", handle_get_interpretation),
+)
+
+# Map language code to Language enum (Azure uses specific locale formats).
+# Module constants so run_bot does not rebuild them for every session; read-only
+# views because every session shares them.
+_LANGUAGE_MAP = MappingProxyType({
+    "en": Language.EN_US,
+    "vi": Language.VI,
+    "es": Language.ES,
+    "fr": Language.FR,
+    "de": Language.DE,
+    "ja": Language.JA,
+    "zh": Language.ZH,
+    "pt": Language.PT,
+})
+
+# Generic language-specific greetings (for non-Vietnamese or no user context)
+_GENERIC_PROMPTS = MappingProxyType({
+    "en": "You are a friendly AI assistant. Greet the user warmly and ask how you can help them today.",
+    "vi": "Bạn là một trợ lý AI thân thiện. Chào người dùng một cách ấm áp và hỏi bạn có thể giúp gì cho họ hôm nay.",
+    "es": "Eres un asistente de IA amable. Saluda al usuario calurosamente y pregunta cómo puedes ayudarlo hoy.",
+    "fr": "Vous êtes un assistant IA amical. Accueillez chaleureusement l'utilisateur et demandez comment vous pouvez l'aider aujourd'hui.",
+    "de": "Du bist ein freundlicher KI-Assistent. Grüße den Benutzer warm und frage, wie du ihm heute helfen kannst.",
+    "ja": "あなたはフレンドリーなAIアシスタントです。ユーザーに温かく挨拶し、今日どのように手伝えるか尋ねます。",
+    "zh": "您是一个友好的AI助手。热情地问候用户，并询问您今天如何能帮助他们。",
+    "pt": "Você é um assistente de IA amigável. Cumprimente o usuário calurosamente e pergunte como você pode ajudá-lo hoje.",
+})
+
+
+# Azure OpenAI clients shared by all bot sessions, keyed by connection settings.
+# AzureLLMService otherwise builds a new client - and a new httpx connection
+# pool with a cold TLS handshake - for every session and never closes it.
+# Each entry remembers the event loop it was created on, because pooled
+# connections cannot be reused from a different loop.
+_azure_openai_clients: dict[tuple[str, str, str], tuple[asyncio.AbstractEventLoop, AsyncAzureOpenAI]] = {}
+
+
+def _get_azure_openai_client(api_key: str, endpoint: str, api_version: str) -> AsyncAzureOpenAI:
+    """
+    Return the process-wide Azure OpenAI client for the given settings.
+
+    Must be called from a running event loop. A new client is created the
+    first time a settings combination is seen on the current loop.
+
+    Args:
+        api_key: Azure OpenAI API key
+        endpoint: Azure OpenAI endpoint URL
+        api_version: Azure OpenAI API version
+
+    Returns:
+        Shared AsyncAzureOpenAI client
+    """
+    loop = asyncio.get_running_loop()
+    key = (api_key, endpoint, api_version)
+
+    cached = _azure_openai_clients.get(key)
+    if cached is not None and cached[0] is loop:
+        return cached[1]
+
+    client = AsyncAzureOpenAI(
+        api_key=api_key,
+        azure_endpoint=endpoint,
+        api_version=api_version,
+    )
+    _azure_openai_clients[key] = (loop, client)
+    return client
+
+
+# aiohttp session shared by all bot sessions using ElevenLabs HTTP streaming,
+# so every sentence reuses pooled keep-alive connections instead of paying a
+# TLS handshake. Like the Azure OpenAI clients, it is bound to the event loop
+# it was created on.
+_elevenlabs_http_session: Optional[tuple[asyncio.AbstractEventLoop, aiohttp.ClientSession]] = None
+
+
+def _get_elevenlabs_http_session() -> aiohttp.ClientSession:
+    """
+    Return the process-wide aiohttp session for ElevenLabs HTTP TTS.
+
+    Must be called from a running event loop. A new session is created the
+    first time it is needed on the current loop (or after it was closed).
+
+    Returns:
+        Shared aiohttp.ClientSession
+    """
+    global _elevenlabs_http_session
+
+    loop = asyncio.get_running_loop()
+    if _elevenlabs_http_session is not None:
+        session_loop, session = _elevenlabs_http_session
+        if session_loop is loop and not session.closed:
+            return session
+
+    session = aiohttp.ClientSession()
+    _elevenlabs_http_session = (loop, session)
+    return session
+
+
+async def close_shared_clients() -> None:
+    """
+    Close the shared HTTP clients created on the current event loop.
+
+    Covers the Azure OpenAI clients and the ElevenLabs HTTP session. Called
+    from the application lifespan shutdown. Clients belonging to other
+    (already closed) loops are simply dropped.
+    """
+    global _elevenlabs_http_session
+
+    loop = asyncio.get_running_loop()
+    clients = list(_azure_openai_clients.values())
+    _azure_openai_clients.clear()
+
+    for client_loop, client in clients:
+        if client_loop is loop:
+            await client.close()
+
+    if _elevenlabs_http_session is not None:
+        session_loop, session = _elevenlabs_http_session
+        _elevenlabs_http_session = None
+        if session_loop is loop:
+            await session.close()
+
+
+# Pipeline runner shared by all bot sessions on the application's event loop.
+# PipelineRunner tracks any number of tasks, so one instance serves every
+# concurrent session instead of each bot building its own.
+_runner: Optional[PipelineRunner] = None
+_runner_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_runner() -> PipelineRunner:
+    """
+    Return the process-wide PipelineRunner for the current event loop.
+
+    The runner is created with handle_sigint=False: a per-bot runner would
+    otherwise install its own SIGINT handler on the server's event loop,
+    replacing the application server's graceful-shutdown handling.
+
+    Returns:
+        Shared PipelineRunner
+    """
+    global _runner, _runner_loop
+
+    loop = asyncio.get_running_loop()
+    if _runner is None or _runner_loop is not loop:
+        _runner = PipelineRunner(handle_sigint=False)
+        _runner_loop = loop
+    return _runner
+
+
+class _SharedClientAzureLLMService(AzureLLMService):
+    """AzureLLMService that reuses the process-wide Azure OpenAI client."""
+
+    def create_client(self, api_key=None, base_url=None, **kwargs):
+        """Return the shared client instead of building one per session."""
+        return _get_azure_openai_client(api_key, self._endpoint, self._api_version)
+
+
+@dataclass(frozen=True, slots=True)
+class _BotConfig:
+    """
+    Immutable snapshot of the settings used by one bot session.
+
+    Taken once at the start of run_bot() so the session reads plain slot
+    attributes instead of going back to the settings object for every
+    service, and so every component of the pipeline sees the same values
+    even if settings are reloaded mid-startup.
     """
-    Save a conversation message to the database asynchronously (non-blocking).
+    azure_speech_api_key: str
+    azure_speech_region: str
+    azure_openai_api_key: str
+    azure_openai_endpoint: str
+    azure_openai_model_deployment_name: str
+    azure_openai_api_version: str
+    elevenlabs_api_key: str
+    elevenlabs_voice_id: str
+    elevenlabs_model: str
+    elevenlabs_http_streaming: bool
+    voice_language: str
+
+    @classmethod
+    def from_settings(cls) -> "_BotConfig":
+        """Snapshot the current application settings."""
+        return cls(**{name: getattr(settings, name) for name in cls.__dataclass_fields__})
+
+
+# Upper bound on messages written in one transaction by a session's writer
+_SAVE_BATCH_SIZE = 32
+
+# Upper bound on messages waiting to be saved; beyond this new messages are dropped
+_SAVE_QUEUE_SIZE = 128
+
+# Threads reserved for message persistence, so slow database writes cannot
+# occupy the default executor that asyncio.to_thread shares with the rest of
+# the voice pipeline (VAD model loading, context lookups, ...)
+_DB_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="msg-db")
+
+# Minimum seconds between full tracebacks for message save failures. While the
+# database is down every batch fails the same way; the first traceback is
+# enough, and later failures log a one-line error.
+_SAVE_TRACEBACK_INTERVAL = 60.0
+_last_save_traceback = float("-inf")
+
+
+def _save_error_wants_traceback() -> bool:
+    """Return True (and start a new interval) if a save failure should log its traceback."""
+    global _last_save_traceback
+
+    now = time.monotonic()
+    if now - _last_save_traceback < _SAVE_TRACEBACK_INTERVAL:
+        return False
+    _last_save_traceback = now
+    return True
+
+
+# Transcript role string → stored MessageRole, resolved once per process
+_TRANSCRIPT_ROLES = MappingProxyType({
+    "user": MessageRole.USER,
+    "assistant": MessageRole.ASSISTANT,
+})
+
+# Queued message: (role, content, timestamp, metadata)
+_QueuedMessage = Tuple[MessageRole, str, datetime, Optional[dict]]
+
+
+async def _save_messages_async(conversation_id: UUID, batch: List[_QueuedMessage]) -> None:
+    """
+    Save a batch of conversation messages to the database asynchronously (non-blocking).
 
     This function runs database operations in a thread pool to avoid blocking
-    the voice pipeline. Errors are logged but don't propagate to prevent
-    breaking the conversation flow.
+    the voice pipeline. All messages in the batch are written with a single
+    multi-row INSERT in one transaction; if that fails, the messages are
+    retried one per transaction so a single bad row does not lose the rest.
+    Errors are logged but don't propagate to prevent breaking the
+    conversation flow.
 
     Args:
-        conversation_id: UUID of the conversation this message belongs to
-        role: Message sender role (user or assistant)
-        content: Full text content of the message
-        metadata: Optional dict with additional data (function calls, etc.)
+        conversation_id: UUID of the conversation the messages belong to
+        batch: Queued messages as (role, content, timestamp, metadata) tuples
 
     Notes:
-        - Uses asyncio.to_thread for non-blocking execution
-        - Errors are logged but swallowed to maintain voice pipeline stability
-        - Creates new database session for each save (thread-safe)
+        - Runs on the dedicated _DB_EXECUTOR threads for non-blocking execution
+        - Errors are logged but swallowed to maintain voice pipeline stability;
+          tracebacks are included at most once per _SAVE_TRACEBACK_INTERVAL
+        - Uses a short-lived session per transaction from the shared
+          SessionLocal factory (pooled connections, no expire/refresh after commit)
     """
+    rows = [
+        {
+            "conversation_id": conversation_id,
+            "role": role,
+            "content": content,
+            "timestamp": timestamp,
+            "message_metadata": metadata or {},
+        }
+        for role, content, timestamp, metadata in batch
+    ]
+
+    def _insert(chunk: List[dict]) -> None:
+        """Write rows with one multi-row INSERT in one transaction."""
+        with SessionLocal() as session:
+            # ORM bulk insert, without building and tracking a model
+            # instance per message
+            session.execute(insert(ConversationMessage), chunk)
+            session.commit()
+
+    def _log_save_error(count: int, e: Exception) -> None:
+        # Log error but don't propagate - voice pipeline must continue
+        logger.error(
+            "Failed to save %d message(s) to database: %r",
+            count,
+            e,
+            exc_info=_save_error_wants_traceback(),
+            extra={
+                "conversation_id": str(conversation_id),
+                "message_count": count
+            }
+        )
+
     def _db_save():
         """Inner function that performs the actual database save."""
         try:
-            with Session(engine) as session:
-                message = ConversationMessage(
-                    conversation_id=conversation_id,
-                    role=role,
-                    content=content,
-                    timestamp=datetime.now(timezone.utc),
-                    message_metadata=metadata or {}
-                )
-                session.add(message)
-                session.commit()
-                logger.debug(
-                    f"Saved {role.value} message to conversation {conversation_id}: "
-                    f"{content[:50]}..." if len(content) > 50 else content
-                )
+            _insert(rows)
+            logger.debug(
+                "Saved %d message(s) to conversation %s",
+                len(rows),
+                conversation_id
+            )
+            return
         except Exception as e:
-            # Log error but don't propagate - voice pipeline must continue
-            logger.error(
-                f"Failed to save {role.value} message to database: {e}",
-                exc_info=True,
-                extra={
-                    "conversation_id": str(conversation_id),
-                    "role": role.value,
-                    "content_length": len(content)
-                }
+            if len(rows) == 1:
+                _log_save_error(1, e)
+                return
+            logger.warning(
+                "Batch save of %d messages to conversation %s failed (%r), "
+                "retrying one at a time",
+                len(rows),
+                conversation_id,
+                e
             )
 
+        for row in rows:
+            try:
+                _insert([row])
+            except Exception as e:
+                _log_save_error(1, e)
+
     # Run database save in thread pool (non-blocking)
     try:
-        await asyncio.to_thread(_db_save)
+        await asyncio.get_running_loop().run_in_executor(_DB_EXECUTOR, _db_save)
     except Exception as e:
         # This should rarely happen (thread pool errors)
-        logger.error(f"Thread pool error saving message: {e}", exc_info=True)
+        logger.error(
+            "Thread pool error saving messages: %r",
+            e,
+            exc_info=_save_error_wants_traceback()
+        )
+
+
+class _MessageWriter:
+    """
+    Background writer that persists one session's conversation messages.
+
+    Replaces a fire-and-forget task per message: the pipeline enqueues
+    messages synchronously, and a single long-lived task drains the queue,
+    writing everything that has accumulated (up to _SAVE_BATCH_SIZE) in one
+    transaction. Messages are written in the order they were spoken, and
+    commit overhead is shared when turns arrive close together (e.g. a user
+    message immediately followed by a short assistant reply).
+    """
+
+    _STOP = object()
+
+    def __init__(self, conversation_id: UUID):
+        self._conversation_id = conversation_id
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=_SAVE_QUEUE_SIZE)
+        self._task = asyncio.create_task(self._run())
+
+    def enqueue(self, role: MessageRole, content: str, metadata: Optional[dict] = None) -> None:
+        """
+        Queue a message for saving, timestamped now (never blocks).
+
+        The queue is bounded so a stalled database cannot grow memory without
+        limit; when it is full the message is dropped with a warning rather
+        than stalling the voice pipeline.
+        """
+        try:
+            self._queue.put_nowait((role, content, datetime.now(timezone.utc), metadata))
+        except asyncio.QueueFull:
+            logger.warning(
+                "Message save queue full for conversation %s, dropping %s message",
+                self._conversation_id,
+                role.value
+            )
+
+    async def on_transcript_update(self, processor, frame) -> None:
+        """
+        TranscriptProcessor "on_transcript_update" handler: queue each message.
+
+        Receives final user transcriptions and assistant text as it was
+        actually spoken (completed when the bot stops speaking or is
+        interrupted).
+        """
+        for message in frame.messages:
+            role = _TRANSCRIPT_ROLES.get(message.role)
+            if role is not None and message.content:
+                self.enqueue(role, message.content)
+
+    async def _run(self) -> None:
+        """Drain the queue in batches until close() is called."""
+        while True:
+            item = await self._queue.get()
+            if item is self._STOP:
+                return
+
+            batch = [item]
+            stopping = False
+            while len(batch) < _SAVE_BATCH_SIZE:
+                try:
+                    item = self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if item is self._STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            await _save_messages_async(self._conversation_id, batch)
+
+            if stopping:
+                return
+
+    async def close(self) -> None:
+        """Write any messages still queued, then stop the writer task."""
+        await self._queue.put(self._STOP)
+        await self._task
 
 
 async def run_bot(
@@ -187,7 +596,7 @@ async def run_bot(
         Returns None if initialization fails
 
     Raises:
-        ValueError: If required API keys are not configured
+        ConfigurationError: If required API keys are not configured
         PipecatBotError: If bot initialization or service setup fails
 
     Example:
@@ -216,11 +625,33 @@ async def run_bot(
     """
     try:
         # Validate configuration (lazy validation pattern)
-        logger.info(f"Starting Pipecat bot for room: {room_url}")
-        _validate_configuration()
+        logger.info("Starting Pipecat bot for room: %s", room_url)
+        config = _BotConfig.from_settings()
+        _validate_configuration(config)
+        voice_language = config.voice_language
+
+        # Load the Silero VAD model in a worker thread while the conversation
+        # history is fetched from Redis/DB, so session startup waits for the
+        # slower of the two rather than their sum. The analyzer is built per
+        # session: Silero keeps per-stream RNN state, so sharing an instance
+        # across rooms would mix their audio history.
+        # TaskGroup cancels the sibling as soon as one step fails, so a broken
+        # startup does not keep waiting on work whose result is discarded.
+        try:
+            async with asyncio.TaskGroup() as startup:
+                vad_task = startup.create_task(asyncio.to_thread(SileroVADAnalyzer))
+                context_task = startup.create_task(
+                    _load_conversation_context(user, voice_language)
+                )
+        except ExceptionGroup as eg:
+            # Report the first failure itself rather than the group wrapper
+            raise eg.exceptions[0] from eg
+
+        vad_analyzer = vad_task.result()
+        conversation_context = context_task.result()
 
         # Configure Daily.co transport with VAD
-        logger.info("Configuring Daily.co transport with VAD")
+        logger.debug("Configuring Daily.co transport with VAD")
         transport = DailyTransport(
             room_url,
             token,
@@ -228,164 +659,107 @@ async def run_bot(
             DailyParams(
                 audio_in_enabled=True,
                 audio_out_enabled=True,
-                vad_analyzer=SileroVADAnalyzer(),
+                vad_analyzer=vad_analyzer,
             )
         )
 
         # Initialize speech services
-        logger.info(f"Initializing speech services (language: {settings.voice_language})")
-
         # Azure Speech: Speech-to-Text with language configuration
-        logger.info(f"Configuring Azure Speech for language: {settings.voice_language}")
-
-        # Map language code to Language enum (Azure uses specific locale formats)
-        language_map = {
-            "en": Language.EN_US,
-            "vi": Language.VI,
-            "es": Language.ES,
-            "fr": Language.FR,
-            "de": Language.DE,
-            "ja": Language.JA,
-            "zh": Language.ZH,
-            "pt": Language.PT,
-        }
-        language_enum = language_map.get(settings.voice_language, Language.EN_US)
+        language_enum = _LANGUAGE_MAP.get(voice_language, Language.EN_US)
 
         stt = AzureSTTService(
-            api_key=settings.azure_speech_api_key,
-            region=settings.azure_speech_region,
+            api_key=config.azure_speech_api_key,
+            region=config.azure_speech_region,
             language=language_enum,
         )
 
-        # Azure OpenAI: Language Model
-        llm = AzureLLMService(
-            api_key=settings.azure_openai_api_key,
-            endpoint=settings.azure_openai_endpoint,
-            model=settings.azure_openai_model_deployment_name,
-            api_version=settings.azure_openai_api_version,
+        # Azure OpenAI: Language Model (shares one HTTP connection pool across sessions)
+        llm = _SharedClientAzureLLMService(
+            api_key=config.azure_openai_api_key,
+            endpoint=config.azure_openai_endpoint,
+            model=config.azure_openai_model_deployment_name,
+            api_version=config.azure_openai_api_version,
             run_in_parallel=False,  # Enable sequential function calling
         )
 
-        # Import numerology function handlers
-        from src.voice_pipeline.function_handlers import (
-            handle_calculate_life_path,
-            handle_calculate_expression,
-            handle_calculate_soul_urge,
-            handle_get_interpretation
-        )
-
         # Register function handlers with LLM service
-        llm.register_function("calculate_life_path", handle_calculate_life_path, cancel_on_interruption=False)
-        llm.register_function("calculate_expression_number", handle_calculate_expression, cancel_on_interruption=False)
-        llm.register_function("calculate_soul_urge_number", handle_calculate_soul_urge, cancel_on_interruption=False)
-        llm.register_function("get_numerology_interpretation", handle_get_interpretation, cancel_on_interruption=False)
+        register = llm.register_function
+        for function_name, handler in _FUNCTION_HANDLERS:
+            register(function_name, handler, cancel_on_interruption=False)
 
-        logger.info("Registered 4 numerology function handlers with LLM service")
+        logger.debug("Registered %d numerology function handlers with LLM service", len(_FUNCTION_HANDLERS))
 
         # ElevenLabs: Text-to-Speech with model configuration
-        logger.info(f"Configuring ElevenLabs TTS with model: {settings.elevenlabs_model}")
-        tts = ElevenLabsTTSService(
-            api_key=settings.elevenlabs_api_key,
-            voice_id=settings.elevenlabs_voice_id,
-            model=settings.elevenlabs_model,
+        # WebSocket by default; HTTP streaming over the shared connection pool if enabled
+        logger.debug(
+            "Configuring ElevenLabs TTS with model: %s (http_streaming=%s)",
+            config.elevenlabs_model,
+            config.elevenlabs_http_streaming
         )
+        if config.elevenlabs_http_streaming:
+            tts = ElevenLabsHttpTTSService(
+                api_key=config.elevenlabs_api_key,
+                voice_id=config.elevenlabs_voice_id,
+                aiohttp_session=_get_elevenlabs_http_session(),
+                model=config.elevenlabs_model,
+            )
+        else:
+            tts = ElevenLabsTTSService(
+                api_key=config.elevenlabs_api_key,
+                voice_id=config.elevenlabs_voice_id,
+                model=config.elevenlabs_model,
+            )
 
         # Initialize conversation with language-aware system prompt
         # For Vietnamese with user object: use specialized numerology prompt
         # Otherwise: use generic language-specific greeting
-        if settings.voice_language == "vi" and user is not None:
+        if voice_language == "vi" and user is not None:
             # Vietnamese with user context: use specialized numerology system prompt
-            from src.voice_pipeline.system_prompts import get_numerology_system_prompt
-            from src.services.conversation_service import get_conversation_context_cached
-
-            # Load conversation history context (cached in Redis)
-            conversation_context = await get_conversation_context_cached(user.id)
-
             # Generate system prompt WITH conversation history
             system_prompt = get_numerology_system_prompt(user, conversation_history=conversation_context)
 
             if conversation_context:
                 logger.info(
-                    f"Generated Vietnamese numerology system prompt with conversation history "
-                    f"for user: {user.full_name} ({len(conversation_context)} chars of context)"
+                    "Generated Vietnamese numerology system prompt with conversation history "
+                    "for user: %s (%d chars of context)",
+                    user.full_name,
+                    len(conversation_context)
                 )
             else:
                 logger.info(
-                    f"Generated Vietnamese numerology system prompt for user: {user.full_name} "
-                    f"(no conversation history)"
+                    "Generated Vietnamese numerology system prompt for user: %s "
+                    "(no conversation history)",
+                    user.full_name
                 )
         else:
             # Generic language-specific greetings (for non-Vietnamese or no user context)
-            generic_prompts = {
-                "en": "You are a friendly AI assistant. Greet the user warmly and ask how you can help them today.",
-                "vi": "Bạn là một trợ lý AI thân thiện. Chào người dùng một cách ấm áp và hỏi bạn có thể giúp gì cho họ hôm nay.",
-                "es": "Eres un asistente de IA amable. Saluda al usuario calurosamente y pregunta cómo puedes ayudarlo hoy.",
-                "fr": "Vous êtes un assistant IA amical. Accueillez chaleureusement l'utilisateur et demandez comment vous pouvez l'aider aujourd'hui.",
-                "de": "Du bist ein freundlicher KI-Assistent. Grüße den Benutzer warm und frage, wie du ihm heute helfen kannst.",
-                "ja": "あなたはフレンドリーなAIアシスタントです。ユーザーに温かく挨拶し、今日どのように手伝えるか尋ねます。",
-                "zh": "您是一个友好的AI助手。热情地问候用户，并询问您今天如何能帮助他们。",
-                "pt": "Você é um assistente de IA amigável. Cumprimente o usuário calurosamente e pergunte como você pode ajudá-lo hoje.",
-            }
-
-            system_prompt = generic_prompts.get(
-                settings.voice_language,
-                generic_prompts["en"]  # Fallback to English
+            system_prompt = _GENERIC_PROMPTS.get(
+                voice_language,
+                _GENERIC_PROMPTS["en"]  # Fallback to English
             )
 
-        messages = [
-            {
-                "role": "system",
-                "content": system_prompt
-            }
-        ]
-
-        # Import numerology function calling tools
-        from src.voice_pipeline.numerology_functions import numerology_tools
-
-        # Create LLM context for managing conversation history with tools
-        llm_context = OpenAILLMContext(messages=messages, tools=numerology_tools)
-        logger.info(f"Registered numerology tools with LLM context")
-
-        # Hook message saving if conversation_id provided
+        # Create LLM context for managing conversation history with tools.
+        # The tools list is the shared module constant - OpenAILLMContext stores
+        # it by reference without validating or copying. The messages list is
+        # built fresh because the aggregators append to it during the session.
+        llm_context = OpenAILLMContext(
+            messages=[{"role": "system", "content": system_prompt}],
+            tools=numerology_tools
+        )
+        logger.debug("Registered numerology tools with LLM context")
+
+        # Record the conversation if conversation_id provided: a TranscriptProcessor
+        # taps the pipeline for final user transcriptions and spoken assistant
+        # text, and the session's writer (started just before the pipeline
+        # runs) persists them in the background
+        transcript = None
+        transcript_user = []
+        transcript_assistant = []
         if conversation_id:
-            logger.info(f"Enabling message saving for conversation {conversation_id}")
-
-            # Wrap context to intercept messages
-            original_add_message = llm_context.add_message
-
-            def add_message_with_save(message: dict):
-                """Intercept add_message calls to save messages to database."""
-                # Call original method
-                result = original_add_message(message)
-
-                # Save message asynchronously (fire-and-forget)
-                role_str = message.get("role", "")
-                content = message.get("content", "")
-
-                if role_str == "user" and content:
-                    # Save user message
-                    asyncio.create_task(
-                        _save_message_async(
-                            conversation_id,
-                            MessageRole.USER,
-                            content
-                        )
-                    )
-                elif role_str == "assistant" and content:
-                    # Save assistant message
-                    asyncio.create_task(
-                        _save_message_async(
-                            conversation_id,
-                            MessageRole.ASSISTANT,
-                            content
-                        )
-                    )
-
-                return result
-
-            # Replace add_message method with wrapped version
-            llm_context.add_message = add_message_with_save
-            logger.info("Message saving hooks installed")
+            logger.debug("Enabling message saving for conversation %s", conversation_id)
+            transcript = TranscriptProcessor()
+            transcript_user = [transcript.user()]
+            transcript_assistant = [transcript.assistant()]
 
         # Create context aggregator using the LLM service
         # This ensures proper function call result handling
@@ -393,41 +767,104 @@ async def run_bot(
 
         # Build complete pipeline
         # Order is critical: input → stt → user_agg → llm → tts → output → assistant_agg
-        logger.info("Building voice pipeline")
+        # (transcript taps sit after stt and after output when saving messages)
+        logger.debug("Building voice pipeline")
         pipeline = Pipeline([
             transport.input(),              # 1. Audio from user (WebRTC)
             stt,                            # 2. Speech-to-text (Azure Speech Service)
+            *transcript_user,               #    Record user transcriptions (if saving)
             context_aggregator.user(),      # 3. Collect user message (using context aggregator)
             llm,                            # 4. Generate response (Azure OpenAI)
             tts,                            # 5. Text-to-speech (ElevenLabs)
             transport.output(),             # 6. Audio to user (WebRTC)
+            *transcript_assistant,          #    Record spoken assistant text (if saving)
             context_aggregator.assistant(), # 7. Store assistant message (using context aggregator)
         ])
 
+        # One summary line for the whole startup; the step-by-step progress
+        # above is logged at DEBUG
+        logger.info(
+            "Pipecat bot ready for room %s: language=%s, stt=%s, llm=%s, tts=%s, "
+            "message_saving=%s",
+            room_url,
+            voice_language,
+            language_enum.value,
+            config.azure_openai_model_deployment_name,
+            config.elevenlabs_model,
+            conversation_id is not None,
+        )
+
         # Create and run pipeline task
-        logger.info("Starting pipeline runner")
         task = PipelineTask(pipeline, params=PipelineParams())
 
         # Run pipeline using PipelineRunner (this is a blocking async call that runs until stopped)
-        runner = PipelineRunner()
-        await runner.run(task)
+        runner = _get_runner()
+
+        # Start the writer last, so a failure while building the pipeline
+        # cannot leave its background task waiting on an empty queue
+        message_writer = None
+        if transcript is not None:
+            message_writer = _MessageWriter(conversation_id)
+            transcript.event_handler("on_transcript_update")(message_writer.on_transcript_update)
+
+        try:
+            await runner.run(task)
+        finally:
+            # Persist whatever the session queued before it ended
+            if message_writer is not None:
+                await message_writer.close()
 
         logger.info("Pipeline execution completed")
         return task
 
-    except ValueError as e:
-        # Configuration errors (missing API keys)
-        logger.error(f"Configuration error: {e}", exc_info=True)
+    except asyncio.CancelledError:
+        # Normal shutdown path when a call ends - no traceback needed
+        logger.info("Pipecat bot cancelled for room: %s", room_url)
+        raise
+
+    except ConfigurationError as e:
+        # Missing API keys - the message lists every missing key, so a
+        # traceback adds nothing. Other ValueErrors fall through below.
+        logger.error("Configuration error: %s", e)
         raise
 
     except Exception as e:
-        # Other errors (service initialization, connection failures)
+        # Other errors (service initialization, connection failures). The bot
+        # runs as a fire-and-forget task, so this log is the only place the
+        # traceback is recorded - keep exc_info here.
         error_msg = f"Failed to start Pipecat bot: {type(e).__name__}: {e}"
         logger.error(error_msg, exc_info=True)
         raise PipecatBotError(error_msg) from e
 
 
-def _validate_configuration() -> None:
+async def _load_conversation_context(
+    user: Optional[User],
+    voice_language: str
+) -> Optional[str]:
+    """
+    Load the user's conversation history context for the system prompt.
+
+    Only the Vietnamese numerology prompt uses conversation history, so this
+    returns None without touching Redis for other languages or anonymous
+    sessions.
+
+    Args:
+        user: Optional User object for the session
+        voice_language: Conversation language code (e.g., "vi")
+
+    Returns:
+        Formatted conversation context string (cached in Redis), or None if
+        history is not used for this session
+    """
+    if voice_language != "vi" or user is None:
+        return None
+
+    from src.services.conversation_service import get_conversation_context_cached
+
+    return await get_conversation_context_cached(user.id)
+
+
+def _validate_configuration(config: Optional[_BotConfig] = None) -> None:
     """
     Validate that all required API keys are configured.
 
@@ -435,53 +872,52 @@ def _validate_configuration() -> None:
     but validation occurs at function call time. This allows tests to mock settings
     without triggering import-time failures.
 
+    Args:
+        config: Settings snapshot to validate. Defaults to a fresh snapshot of
+                the current application settings.
+
     Raises:
-        ValueError: If any required API key is missing, with descriptive message
-                   indicating which key needs to be configured
+        ConfigurationError: If any required API key is missing, with descriptive
+                   message indicating which key needs to be configured
 
     Notes:
+        - Runs once per process: settings are immutable after startup, so a
+          successful check is remembered (see _reset_config_validation)
         - Checks three external service API keys: Azure Speech, Azure OpenAI, ElevenLabs
         - Validates Azure OpenAI endpoint URL separately
         - Error messages include instructions for obtaining API keys
     """
-    missing_keys = []
+    global _config_validated
 
-    if not settings.azure_speech_api_key:
-        missing_keys.append(
-            "AZURE_SPEECH_API_KEY (speech-to-text)\n"
-            "  Get from: https://portal.azure.com/ → Speech Services → Keys and Endpoint"
-        )
+    if _config_validated:
+        return
 
-    if not settings.azure_openai_api_key:
-        missing_keys.append(
-            "AZURE_OPENAI_API_KEY (language model)\n"
-            "  Get from: https://portal.azure.com/ → Azure OpenAI Service → Keys"
-        )
+    if config is None:
+        config = _BotConfig.from_settings()
 
-    if not settings.azure_openai_endpoint:
-        missing_keys.append(
-            "AZURE_OPENAI_ENDPOINT (Azure endpoint URL)\n"
-            "  Get from: https://portal.azure.com/ → Azure OpenAI Service → Endpoint"
-        )
-
-    if not settings.elevenlabs_api_key:
-        missing_keys.append(
-            "ELEVENLABS_API_KEY (text-to-speech)\n"
-            "  Get from: https://elevenlabs.io/ → Profile → API Keys"
-        )
+    missing_keys = [
+        help_text for field, help_text in _API_KEY_HELP
+        if not getattr(config, field)
+    ]
 
     if missing_keys:
-        error_message = (
-            "Voice pipeline API keys not configured. "
-            "Set the following environment variables in .env file:\n\n" +
-            "\n\n".join(missing_keys) +
-            "\n\nSee backend/.env.example for setup instructions."
-        )
-        raise ValueError(error_message)
+        raise ConfigurationError(_MISSING_KEYS_MESSAGE.format("\n\n".join(missing_keys)))
 
+    _config_validated = True
     logger.debug("All API keys validated successfully")
 
 
+def _reset_config_validation() -> None:
+    """
+    Forget a previous successful validation.
+
+    Tests call this between cases that patch settings; in the application
+    settings do not change after startup, so validation only runs once.
+    """
+    global _config_validated
+    _config_validated = False
+
+
 # Manual testing support
 """
 Manual Testing Instructions:
@@ -22,6 +22,8 @@ Integration with Pipecat bot (Story 4.4 function handlers + Story 4.3 tool defin
 """
 
 import logging
+from bisect import bisect_right
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict
 from datetime import datetime
@@ -40,6 +42,142 @@ logger = logging.getLogger(__name__)
 # Path to the system prompt template
 PROMPT_TEMPLATE_PATH = Path(__file__).parent / "prompts" / "aria_system_prompt.md"
 
+# First line of the formatted conversation history
+_HISTORY_HEADER = "Previous conversations with this user:"
+
+# Minimal prompt used when the template cannot be loaded or rendered
+_FALLBACK_PROMPT = """<agent name="Aria" role="Nhà Thần Số Học">
+
+Tôi là Aria, một nhà thần số học Pythagorean. Tôi ấm áp, khôn ngoan, và thực sự quan tâm đến việc
+giúp bạn hiểu biết về thần số học.
+
+<knowledge>
+- Life Path Number (Số Đường Đời): Tính từ ngày sinh
+- Expression Number (Số Biểu Hiện): Tính từ họ tên
+- Soul Urge Number (Số Khát Khao): Tính từ nguyên âm trong tên
+- Master Numbers: 11, 22, 33
+</knowledge>
+
+<style>
+Tôi nói chuyện tự nhiên, thân mật, và chậm rãi. Mỗi lần chỉ chia sẻ một ý tưởng, và luôn lắng nghe
+phản hồi của bạn trước khi tiếp tục. Tôi đặt câu hỏi để hiểu sâu hơn về tình huống của bạn.
+</style>
+
+<tools>
+- calculate_life_path(birth_date): Tính Số Đường Đời
+- calculate_expression_number(full_name): Tính Số Biểu Hiện
+- calculate_soul_urge_number(full_name): Tính Số Khát Khao
+- get_numerology_interpretation(number_type, number_value): Lấy giải nghĩa
+</tools>
+
+<boundaries>
+Thần số học là để giải trí và hướng dẫn tâm linh. Tôi không đưa ra lời khuyên về y tế, pháp lý,
+hoặc tài chính. Nếu vấn đề nghiêm trọng, tôi khuyến khích bạn tìm trợ giúp chuyên nghiệp.
+</boundaries>
+
+Chào bạn! Mình là Aria. Hôm nay bạn muốn khám phá điều gì về bản thân qua thần số học nhỉ?
+
+</agent>"""
+
+# Floor for the per-conversation insight budget in format_conversation_history,
+# so an insight is never cut to a couple of meaningless tokens
+_MIN_INSIGHT_TOKENS = 10
+
+# Guidance appended after the conversation history, telling the assistant how
+# to use it. Module constant so it is not part of get_numerology_system_prompt;
+# {user_name} is filled in per user.
+_HISTORY_GUIDANCE_TEMPLATE = """
+## Tận dụng lịch sử trò chuyện (Using Conversation History)
+
+Bạn đã có lịch sử trò chuyện với người dùng này. Hãy sử dụng thông tin đó một cách tự nhiên và chân thành:
+
+**Khi chào hỏi:**
+- Chào hỏi ấm áp và nhắc đến chủ đề đã thảo luận trước đó
+- Ví dụ: "Chào {user_name}! Rất vui được gặp lại bạn. Lần trước chúng ta đã nói về [chủ đề]..."
+- Thể hiện sự quan tâm thực sự đến hành trình của họ
+
+**Khi trả lời câu hỏi:**
+- Liên hệ với những gì đã biết từ cuộc trò chuyện trước
+- Ví dụ: "Như mình đã chia sẻ lần trước, [số] của bạn cho thấy [đặc điểm]. Hôm nay chúng ta có thể đào sâu hơn về..."
+- Xây dựng dựa trên những insight đã có thay vì lặp lại
+
+**Khi khám phá sâu hơn:**
+- Nhận ra các mẫu hình (patterns) xuyên suốt các cuộc trò chuyện
+- Ví dụ: "Bạn có nhớ lần trước mình nói về [đặc điểm]? Điều bạn đang chia sẻ hôm nay phản ánh đúng bản chất đó..."
+- Giúp người dùng thấy sự liên kết giữa các khía cạnh numerology khác nhau
+
+**Khi người dùng hỏi lại:**
+- Nếu họ hỏi về thông tin đã thảo luận, hãy tóm tắt ngắn gọn và đề nghị đào sâu thêm
+- Ví dụ: "Đúng rồi, số [X] của bạn... Lần này bạn muốn khám phá khía cạnh nào của nó?"
+
+**Nguyên tắc quan trọng:**
+- Đừng lặp lại y hệt những gì đã nói trước đó
+- Luôn mang đến giá trị mới trong mỗi cuộc trò chuyện
+- Thể hiện sự tiến triển và hiểu biết sâu hơn về người dùng
+- Giữ không khí thân thiện, ấm áp như gặp lại người bạn thân
+
+Hãy làm cho người dùng cảm thấy được nhớ đến, được hiểu, và mỗi cuộc trò chuyện đều có ý nghĩa riêng.
+"""
+
+
+@lru_cache(maxsize=8)
+def _get_encoding(model: str):
+    """
+    Return the tiktoken encoding for a model, resolved once per process.
+
+    encoding_for_model() looks the model up in tiktoken's registry and
+    builds the BPE encoder, and format_conversation_history() counts tokens
+    several times per prompt. Not preloaded at import: the first lookup may
+    download the BPE ranks file, which should not happen at import time.
+    Errors propagate and are not cached.
+
+    Args:
+        model: Model name for encoding (e.g. "gpt-4")
+
+    Returns:
+        tiktoken.Encoding for the model
+    """
+    return tiktoken.encoding_for_model(model)
+
+
+def truncate_to_tokens(text: str, max_tokens: int, model: str = "gpt-4") -> str:
+    """
+    Cut text to at most max_tokens tokens.
+
+    Cuts on a token boundary using the cached encoding, and drops a trailing
+    partial character when the cut falls inside a multi-byte character (common
+    for Vietnamese text). Text already within the budget is returned unchanged.
+
+    Args:
+        text: Text to truncate
+        max_tokens: Maximum number of tokens to keep
+        model: Model name for encoding (default: "gpt-4")
+
+    Returns:
+        str: Text within the token budget
+
+    Note:
+        If tiktoken is not available, keeps ~4 chars per token (same
+        estimate as count_tokens)
+    """
+    # Byte-level BPE: every token covers at least one UTF-8 byte (but one
+    # character can take several tokens), so text this short always fits
+    if len(text.encode("utf-8")) <= max_tokens:
+        return text
+
+    if tiktoken is None:
+        return text[:max_tokens * 4]
+
+    try:
+        encoding = _get_encoding(model)
+        tokens = encoding.encode(text)
+        if len(tokens) <= max_tokens:
+            return text
+        return encoding.decode(tokens[:max_tokens]).rstrip("\ufffd")
+    except Exception as e:
+        logger.warning("Error truncating to tokens: %s - falling back to estimation", e)
+        return text[:max_tokens * 4]
+
 
 def count_tokens(text: str, model: str = "gpt-4") -> int:
     """
@@ -61,16 +199,15 @@ def count_tokens(text: str, model: str = "gpt-4") -> int:
     if tiktoken is None:
         # Fallback estimation: roughly 4 characters per token
         estimated = len(text) // 4
-        logger.debug(f"Estimated {estimated} tokens (tiktoken unavailable)")
+        logger.debug("Estimated %d tokens (tiktoken unavailable)", estimated)
         return estimated
 
     try:
-        encoding = tiktoken.encoding_for_model(model)
-        token_count = len(encoding.encode(text))
-        logger.debug(f"Counted {token_count} tokens in text ({len(text)} chars)")
+        token_count = len(_get_encoding(model).encode(text))
+        logger.debug("Counted %d tokens in text (%d chars)", token_count, len(text))
         return token_count
     except Exception as e:
-        logger.warning(f"Error counting tokens: {e} - falling back to estimation")
+        logger.warning("Error counting tokens: %s - falling back to estimation", e)
         return len(text) // 4
 
 
@@ -82,14 +219,16 @@ def format_conversation_history(
     Format conversation summaries for system prompt with token limits.
 
     Creates a concise summary of past conversations optimized for LLM context.
-    If the formatted context exceeds max_tokens, progressively reduces the
-    number of conversations until it fits.
+    If the formatted context exceeds max_tokens, keeps the largest leading
+    subset of conversations that fits, found by binary search over
+    per-conversation token counts.
 
     Args:
         conversations: List of conversation dicts with keys:
             - date: ISO 8601 timestamp string
             - topic: Main topic discussed
-            - insights: Key insights (truncated to 100 chars)
+            - insights: Key insights (truncated to 100 chars and to an equal
+              share of a quarter of max_tokens, at least 10 tokens)
             - numbers: Numbers discussed (comma-separated)
         max_tokens: Maximum tokens allowed for context (default: 500)
 
@@ -112,66 +251,137 @@ def format_conversation_history(
     if not conversations:
         return ""
 
-    def _format_conversations(convs: List[Dict]) -> str:
-        """Inner function to format a specific number of conversations."""
-        parts = ["Previous conversations with this user:"]
+    # Each insight gets an equal share of a quarter of the budget, so with many
+    # conversations the insights shrink before whole conversations are dropped
+    insight_token_budget = max(
+        max_tokens // (len(conversations) * 4),
+        _MIN_INSIGHT_TOKENS
+    )
 
-        for i, conv in enumerate(convs, 1):
-            try:
-                # Parse and format date
-                date_obj = datetime.fromisoformat(conv["date"].replace("Z", "+00:00"))
-                date_str = date_obj.strftime("%b %d")
-            except (ValueError, KeyError):
-                date_str = "Recent"
+    def _format_entry(i: int, conv: Dict) -> str:
+        """Inner function to format one numbered conversation entry."""
+        try:
+            # Parse and format date (fromisoformat accepts a "Z" suffix on 3.11+)
+            date_obj = datetime.fromisoformat(conv["date"])
+            date_str = date_obj.strftime("%b %d")
+        except (ValueError, KeyError):
+            date_str = "Recent"
 
-            topic = conv.get("topic", "General discussion")
-            insights = conv.get("insights", "")[:100]  # Truncate to 100 chars
-            numbers = conv.get("numbers", "")
+        topic = conv.get("topic", "General discussion")
+        # Truncate to 100 chars, then to the per-insight token budget
+        insights = truncate_to_tokens(conv.get("insights", "")[:100], insight_token_budget)
+        numbers = conv.get("numbers", "")
 
-            # Build conversation entry
-            entry = f"{i}. {date_str}: {topic}."
-            if numbers:
-                entry += f" Discussed numbers: {numbers}."
-            if insights:
-                entry += f" Key insight: {insights}"
+        # Build conversation entry (parts joined once)
+        entry_parts = [f"{i}. {date_str}: {topic}."]
+        if numbers:
+            entry_parts.append(f" Discussed numbers: {numbers}.")
+        if insights:
+            entry_parts.append(f" Key insight: {insights}")
 
-            parts.append(entry)
+        return "".join(entry_parts)
 
-        return "\n".join(parts)
+    # Format every entry once; shorter contexts are prefixes of this list
+    entries = [_format_entry(i, conv) for i, conv in enumerate(conversations, 1)]
 
     # Try formatting all conversations
-    context = _format_conversations(conversations)
+    context = "\n".join([_HISTORY_HEADER, *entries])
     token_count = count_tokens(context)
 
     # If within limit, return as-is
     if token_count <= max_tokens:
         logger.debug(
-            f"Formatted {len(conversations)} conversations "
-            f"({token_count} tokens, under {max_tokens} limit)"
+            "Formatted %d conversations (%d tokens, under %d limit)",
+            len(conversations),
+            token_count,
+            max_tokens
         )
         return context
 
-    # Progressively reduce conversations until under limit
-    for reduced_count in range(len(conversations) - 1, 0, -1):
-        context = _format_conversations(conversations[:reduced_count])
+    # Count the header and each entry once and keep running totals: the cost
+    # of the first k conversations is prefix_tokens[k], and the largest k that
+    # fits is found by binary search over those totals without re-encoding
+    # joined text. Tokens rarely merge across the "\n" separators, so the
+    # chosen context is counted once more to confirm, stepping back if the
+    # estimate was short.
+    newline_tokens = count_tokens("\n")
+    prefix_tokens = [count_tokens(_HISTORY_HEADER)]
+    for entry in entries:
+        prefix_tokens.append(prefix_tokens[-1] + newline_tokens + count_tokens(entry))
+
+    best_count = max(bisect_right(prefix_tokens, max_tokens) - 1, 0)
+    best_count = min(best_count, len(entries) - 1)
+    while best_count:
+        context = "\n".join([_HISTORY_HEADER, *entries[:best_count]])
         token_count = count_tokens(context)
-
         if token_count <= max_tokens:
             logger.info(
-                f"Reduced to {reduced_count} conversations to fit token limit "
-                f"({token_count} tokens)"
+                "Reduced to %d conversations to fit token limit (%d tokens)",
+                best_count,
+                token_count
             )
             return context
+        best_count -= 1
 
     # If even 1 conversation is too long, return minimal context
     minimal = f"User has {len(conversations)} previous conversations about numerology."
     logger.warning(
-        f"Could not fit any full conversations in {max_tokens} tokens - "
-        f"returning minimal context"
+        "Could not fit any full conversations in %d tokens - returning minimal context",
+        max_tokens
     )
     return minimal
 
 
+@lru_cache(maxsize=1)
+def _load_prompt_template() -> str:
+    """
+    Read and decode the system prompt template once per process.
+
+    Loaded lazily on first use rather than at import time so a missing
+    template surfaces through get_numerology_system_prompt's fallback path
+    instead of breaking the import. Errors propagate and are not cached.
+
+    Returns:
+        str: Raw template text with {user_name}/{birth_date_formatted} fields
+    """
+    return PROMPT_TEMPLATE_PATH.read_text(encoding='utf-8')
+
+
+@lru_cache(maxsize=1024)
+def _render_user_prompt(user_name: str, birth_date_formatted: str) -> str:
+    """
+    Render the system prompt template for one user, memoized per user.
+
+    The rendered base prompt depends only on the user's display name and
+    birth date, so reconnects and repeat sessions for the same user reuse it
+    instead of re-reading and re-formatting the template. Keying on the
+    rendered values (not the user id) means a profile change naturally
+    misses the cache. Errors propagate and are not cached.
+
+    Args:
+        user_name: Name to address the user by
+        birth_date_formatted: Birth date in DD/MM/YYYY format (or placeholder)
+
+    Returns:
+        str: Personalized prompt without conversation history
+    """
+    return _load_prompt_template().format_map({
+        "user_name": user_name,
+        "birth_date_formatted": birth_date_formatted
+    })
+
+
+def clear_system_prompt_cache() -> None:
+    """
+    Clear the cached template and memoized per-user prompts.
+
+    Call after editing the prompt template in a running process so new
+    sessions pick up the change.
+    """
+    _load_prompt_template.cache_clear()
+    _render_user_prompt.cache_clear()
+
+
 def get_numerology_system_prompt(user: User, conversation_history: str = "") -> str:
     """
     Generate a Vietnamese system prompt for the numerology voice AI bot with conversation context.
@@ -209,64 +419,29 @@ def get_numerology_system_prompt(user: User, conversation_history: str = "") ->
         # Handle None full_name
         user_name = user.full_name if user.full_name else 'bạn'
 
-        # Load system prompt template from markdown file
-        prompt_template = PROMPT_TEMPLATE_PATH.read_text(encoding='utf-8')
-
-        # Substitute user-specific variables
-        prompt = prompt_template.format(
-            user_name=user_name,
-            birth_date_formatted=birth_date_formatted
-        )
+        # Load the template and substitute user-specific variables (memoized per user)
+        prompt = _render_user_prompt(user_name, birth_date_formatted)
 
         # Append conversation history if provided
         if conversation_history:
-            prompt += f"\n\n{conversation_history}\n\n"
-            prompt += """
-## Tận dụng lịch sử trò chuyện (Using Conversation History)
-
-Bạn đã có lịch sử trò chuyện với người dùng này. Hãy sử dụng thông tin đó một cách tự nhiên và chân thành:
-
-**Khi chào hỏi:**
-- Chào hỏi ấm áp và nhắc đến chủ đề đã thảo luận trước đó
-- Ví dụ: "Chào {user_name}! Rất vui được gặp lại bạn. Lần trước chúng ta đã nói về [chủ đề]..."
-- Thể hiện sự quan tâm thực sự đến hành trình của họ
-
-**Khi trả lời câu hỏi:**
-- Liên hệ với những gì đã biết từ cuộc trò chuyện trước
-- Ví dụ: "Như mình đã chia sẻ lần trước, [số] của bạn cho thấy [đặc điểm]. Hôm nay chúng ta có thể đào sâu hơn về..."
-- Xây dựng dựa trên những insight đã có thay vì lặp lại
-
-**Khi khám phá sâu hơn:**
-- Nhận ra các mẫu hình (patterns) xuyên suốt các cuộc trò chuyện
-- Ví dụ: "Bạn có nhớ lần trước mình nói về [đặc điểm]? Điều bạn đang chia sẻ hôm nay phản ánh đúng bản chất đó..."
-- Giúp người dùng thấy sự liên kết giữa các khía cạnh numerology khác nhau
-
-**Khi người dùng hỏi lại:**
-- Nếu họ hỏi về thông tin đã thảo luận, hãy tóm tắt ngắn gọn và đề nghị đào sâu thêm
-- Ví dụ: "Đúng rồi, số [X] của bạn... Lần này bạn muốn khám phá khía cạnh nào của nó?"
-
-**Nguyên tắc quan trọng:**
-- Đừng lặp lại y hệt những gì đã nói trước đó
-- Luôn mang đến giá trị mới trong mỗi cuộc trò chuyện
-- Thể hiện sự tiến triển và hiểu biết sâu hơn về người dùng
-- Giữ không khí thân thiện, ấm áp như gặp lại người bạn thân
-
-Hãy làm cho người dùng cảm thấy được nhớ đến, được hiểu, và mỗi cuộc trò chuyện đều có ý nghĩa riêng.
-"""
+            guidance = _HISTORY_GUIDANCE_TEMPLATE.format(user_name=user_name)
+            prompt = "\n\n".join([prompt, conversation_history, guidance])
             logger.info(
-                f"Generated system prompt with enhanced conversation history guidance for user: {user_name} "
-                f"({len(conversation_history)} chars of context)"
+                "Generated system prompt with enhanced conversation history guidance for user: %s "
+                "(%d chars of context)",
+                user_name,
+                len(conversation_history)
             )
         else:
-            logger.info(f"Generated system prompt (no conversation history) for user: {user_name}")
+            logger.info("Generated system prompt (no conversation history) for user: %s", user_name)
 
         return prompt
 
     except FileNotFoundError:
-        logger.error(f"System prompt template not found at: {PROMPT_TEMPLATE_PATH}", exc_info=True)
+        logger.error("System prompt template not found at: %s", PROMPT_TEMPLATE_PATH, exc_info=True)
         return _get_fallback_prompt()
     except Exception as e:
-        logger.error(f"Error generating system prompt: {str(e)}", exc_info=True)
+        logger.error("Error generating system prompt: %s", e, exc_info=True)
         return _get_fallback_prompt()
 
 
@@ -277,38 +452,5 @@ def _get_fallback_prompt() -> str:
     Returns:
         str: Minimal but functional Vietnamese system prompt
     """
-    fallback_prompt = """<agent name="Aria" role="Nhà Thần Số Học">
-
-Tôi là Aria, một nhà thần số học Pythagorean. Tôi ấm áp, khôn ngoan, và thực sự quan tâm đến việc
-giúp bạn hiểu biết về thần số học.
-
-<knowledge>
-- Life Path Number (Số Đường Đời): Tính từ ngày sinh
-- Expression Number (Số Biểu Hiện): Tính từ họ tên
-- Soul Urge Number (Số Khát Khao): Tính từ nguyên âm trong tên
-- Master Numbers: 11, 22, 33
-</knowledge>
-
-<style>
-Tôi nói chuyện tự nhiên, thân mật, và chậm rãi. Mỗi lần chỉ chia sẻ một ý tưởng, và luôn lắng nghe
-phản hồi của bạn trước khi tiếp tục. Tôi đặt câu hỏi để hiểu sâu hơn về tình huống của bạn.
-</style>
-
-<tools>
-- calculate_life_path(birth_date): Tính Số Đường Đời
-- calculate_expression_number(full_name): Tính Số Biểu Hiện
-- calculate_soul_urge_number(full_name): Tính Số Khát Khao
-- get_numerology_interpretation(number_type, number_value): Lấy giải nghĩa
-</tools>
-
-<boundaries>
-Thần số học là để giải trí và hướng dẫn tâm linh. Tôi không đưa ra lời khuyên về y tế, pháp lý,
-hoặc tài chính. Nếu vấn đề nghiêm trọng, tôi khuyến khích bạn tìm trợ giúp chuyên nghiệp.
-</boundaries>
-
-Chào bạn! Mình là Aria. Hôm nay bạn muốn khám phá điều gì về bản thân qua thần số học nhỉ?
-
-</agent>"""
-
     logger.warning("Using fallback prompt")
-    return fallback_prompt
+    return _FALLBACK_PROMPT
@@ -284,6 +284,40 @@ def test_end_conversation_daily_deletion_failure(mock_delete_room, test_user, se
     pass
 
 
+@pytest.mark.asyncio
+@patch("src.api.v1.endpoints.conversations.delete_room")
+async def test_end_conversation_commits_when_summary_query_fails(
+    mock_delete_room, test_user, session: Session
+):
+    """Test a failed summary read on the request session does not block the end commit."""
+    from sqlalchemy import text
+    from src.api.v1.endpoints.conversations import end_conversation
+
+    conversation = Conversation(user_id=test_user.id)
+    session.add(conversation)
+    session.commit()
+    session.refresh(conversation)
+
+    def failing_summary(shared_session, conversation_id):
+        # Fails inside the database, which aborts the enclosing transaction
+        shared_session.exec(text("SELECT * FROM missing_summary_table"))
+
+    with patch(
+        "src.services.conversation_service._summarize_conversation",
+        side_effect=failing_summary
+    ), patch(
+        "src.services.conversation_service.invalidate_conversation_context_cache",
+        new=AsyncMock()
+    ):
+        result = await end_conversation(conversation.id, current_user=test_user, session=session)
+
+    assert result["conversation"]["ended_at"] is not None
+    session.expire_all()
+    saved = session.get(Conversation, conversation.id)
+    assert saved.ended_at is not None
+    assert saved.main_topic == "General discussion"
+
+
 def test_end_conversation_duration_calculation():
     """Test duration is correctly calculated when ending conversation."""
     # Create conversation with known start time
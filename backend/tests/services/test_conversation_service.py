@@ -5,15 +5,20 @@ Tests conversation history retrieval, formatting, and Redis caching.
 """
 
 import pytest
+import zlib
 from uuid import uuid4
 from datetime import datetime, timezone, timedelta
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, AsyncMock
 
 from src.services.conversation_service import (
     get_recent_conversations,
     get_conversation_context_cached,
-    invalidate_conversation_context_cache
+    invalidate_conversation_context_cache,
+    generate_conversation_summary,
+    _CTX_FMT_VERSION,
+    _RELEASE_LOCK_SCRIPT
 )
+from src.models.conversation_message import MessageRole
 
 
 class TestGetRecentConversations:
@@ -155,8 +160,8 @@ class TestGetConversationContextCached:
         user_id = uuid4()
         cached_context = "Previous conversations with this user:\n1. Nov 23: Life Path Number."
 
-        with patch('src.services.conversation_service.get_redis_client') as mock_get_redis:
-            mock_redis = Mock()
+        with patch('src.services.conversation_service.get_async_redis_client') as mock_get_redis:
+            mock_redis = AsyncMock()
             mock_redis.get.return_value = cached_context
             mock_get_redis.return_value = mock_redis
 
@@ -165,18 +170,52 @@ class TestGetConversationContextCached:
 
             # Assert
             assert result == cached_context
-            mock_redis.get.assert_called_once_with(f"context:{user_id}")
-            mock_redis.set.assert_not_called()  # Should not write on cache hit
+            mock_redis.get.assert_awaited_once_with(f"context:{_CTX_FMT_VERSION}:{user_id}")
+            mock_redis.set.assert_not_awaited()  # Should not write on cache hit
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_decompresses_cached_value(self):
+        """Test that compressed cache entries are decompressed on read."""
+        user_id = uuid4()
+        cached_context = "Previous conversations with this user:\n1. Nov 23: Life Path Number."
+
+        with patch('src.services.conversation_service.get_async_redis_client') as mock_get_redis:
+            mock_redis = AsyncMock()
+            mock_redis.get.return_value = zlib.compress(cached_context.encode("utf-8"))
+            mock_get_redis.return_value = mock_redis
+
+            # Execute
+            result = await get_conversation_context_cached(user_id)
+
+            # Assert
+            assert result == cached_context
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_accepts_uncompressed_legacy_value(self):
+        """Test that plain UTF-8 entries written before compression still load."""
+        user_id = uuid4()
+        cached_context = "Previous conversations with this user:\n1. Nov 23: Life Path Number."
+
+        with patch('src.services.conversation_service.get_async_redis_client') as mock_get_redis:
+            mock_redis = AsyncMock()
+            mock_redis.get.return_value = cached_context.encode("utf-8")
+            mock_get_redis.return_value = mock_redis
+
+            # Execute
+            result = await get_conversation_context_cached(user_id)
+
+            # Assert
+            assert result == cached_context
 
     @pytest.mark.asyncio
     async def test_cache_miss_computes_and_stores(self):
         """Test that context is computed and stored on cache miss."""
         user_id = uuid4()
 
-        with patch('src.services.conversation_service.get_redis_client') as mock_get_redis, \
+        with patch('src.services.conversation_service.get_async_redis_client') as mock_get_redis, \
              patch('src.services.conversation_service.get_recent_conversations') as mock_get_convos:
 
-            mock_redis = Mock()
+            mock_redis = AsyncMock()
             mock_redis.get.return_value = None  # Cache miss
             mock_get_redis.return_value = mock_redis
 
@@ -197,17 +236,113 @@ class TestGetConversationContextCached:
             # Assert
             assert "Previous conversations with this user:" in result
             assert "Life Path Number" in result
-            mock_redis.set.assert_called_once()
+            # Lock acquisition + cache write; the last write is the cached context
+            assert mock_redis.set.call_count == 2
             # Verify TTL is 1800 seconds (30 minutes)
             call_args = mock_redis.set.call_args
+            assert call_args[0][0] == f"context:{_CTX_FMT_VERSION}:{user_id}"
+            assert zlib.decompress(call_args[0][1]).decode("utf-8") == result
             assert call_args[1]['ex'] == 1800
 
+    @pytest.mark.asyncio
+    async def test_cache_miss_acquires_and_releases_lock(self):
+        """Test that the recomputing caller holds the single-flight lock."""
+        user_id = uuid4()
+
+        with patch('src.services.conversation_service.get_async_redis_client') as mock_get_redis, \
+             patch('src.services.conversation_service.get_recent_conversations') as mock_get_convos:
+
+            mock_redis = AsyncMock()
+            mock_redis.get.return_value = None  # Cache miss
+            mock_redis.set.return_value = True  # Lock acquired
+            mock_get_redis.return_value = mock_redis
+            mock_get_convos.return_value = []
+
+            # Execute
+            await get_conversation_context_cached(user_id)
+
+            # Assert
+            lock_call = mock_redis.set.call_args_list[0]
+            assert lock_call[0][0] == f"ctx_lock:{user_id}"
+            assert lock_call[1]['nx'] is True
+            lock_token = lock_call[0][1]
+            # Released with compare-and-delete on the token it was acquired with
+            mock_redis.eval.assert_awaited_once_with(
+                _RELEASE_LOCK_SCRIPT, 1, f"ctx_lock:{user_id}", lock_token
+            )
+            mock_redis.delete.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_expired_lock_taken_by_another_caller_is_not_released(self):
+        """Test that a slow holder does not delete a lock re-acquired by someone else."""
+        user_id = uuid4()
+        lock_key = f"ctx_lock:{user_id}"
+        store = {}
+
+        async def fake_set(key, value, nx=False, ex=None):
+            if nx and key in store:
+                return None
+            store[key] = value
+            return True
+
+        async def fake_eval(script, numkeys, key, token):
+            # Same semantics as _RELEASE_LOCK_SCRIPT
+            if store.get(key) == token:
+                del store[key]
+                return 1
+            return 0
+
+        async def slow_compute(user_id, limit):
+            # Our lock expires mid-compute and another caller takes it
+            store[lock_key] = "other-owner-token"
+            return []
+
+        with patch('src.services.conversation_service.get_async_redis_client') as mock_get_redis, \
+             patch('src.services.conversation_service.get_recent_conversations', side_effect=slow_compute):
+
+            mock_redis = AsyncMock()
+            mock_redis.get.return_value = None  # Cache miss
+            mock_redis.set.side_effect = fake_set
+            mock_redis.eval.side_effect = fake_eval
+            mock_get_redis.return_value = mock_redis
+
+            # Execute
+            await get_conversation_context_cached(user_id)
+
+            # Assert - the other caller still holds its lock
+            assert store[lock_key] == "other-owner-token"
+            mock_redis.delete.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_waits_for_cache_when_lock_held(self):
+        """Test that a concurrent miss waits for the lock holder instead of recomputing."""
+        user_id = uuid4()
+        cached_context = "Previous conversations with this user:\n1. Nov 23: Life Path Number."
+
+        with patch('src.services.conversation_service.get_async_redis_client') as mock_get_redis, \
+             patch('src.services.conversation_service.get_recent_conversations') as mock_get_convos, \
+             patch('src.services.conversation_service.CONTEXT_LOCK_POLL_INTERVAL', 0):
+
+            mock_redis = AsyncMock()
+            # Miss on first check, populated by the lock holder on the next poll
+            mock_redis.get.side_effect = [None, None, cached_context]
+            mock_redis.set.return_value = None  # Lock held by another caller
+            mock_get_redis.return_value = mock_redis
+
+            # Execute
+            result = await get_conversation_context_cached(user_id)
+
+            # Assert
+            assert result == cached_context
+            mock_get_convos.assert_not_called()
+            mock_redis.delete.assert_not_awaited()
+
     @pytest.mark.asyncio
     async def test_returns_empty_string_on_error(self):
         """Test that empty string is returned on Redis error."""
         user_id = uuid4()
 
-        with patch('src.services.conversation_service.get_redis_client') as mock_get_redis:
+        with patch('src.services.conversation_service.get_async_redis_client') as mock_get_redis:
             mock_get_redis.side_effect = Exception("Redis connection failed")
 
             # Execute
@@ -225,25 +360,97 @@ class TestInvalidateConversationContextCache:
         """Test that cache key is deleted for user."""
         user_id = uuid4()
 
-        with patch('src.services.conversation_service.get_redis_client') as mock_get_redis:
-            mock_redis = Mock()
+        with patch('src.services.conversation_service.get_async_redis_client') as mock_get_redis:
+            mock_redis = AsyncMock()
             mock_get_redis.return_value = mock_redis
 
             # Execute
             await invalidate_conversation_context_cache(user_id)
 
             # Assert
-            mock_redis.delete.assert_called_once_with(f"context:{user_id}")
+            mock_redis.delete.assert_awaited_once_with(f"context:{_CTX_FMT_VERSION}:{user_id}")
 
     @pytest.mark.asyncio
     async def test_handles_redis_error_gracefully(self):
         """Test that function doesn't raise exception on Redis error."""
         user_id = uuid4()
 
-        with patch('src.services.conversation_service.get_redis_client') as mock_get_redis:
+        with patch('src.services.conversation_service.get_async_redis_client') as mock_get_redis:
             mock_get_redis.side_effect = Exception("Redis error")
 
             # Execute - should not raise exception
             await invalidate_conversation_context_cache(user_id)
 
             # No assertion needed - test passes if no exception raised
+
+
+class TestGenerateConversationSummary:
+    """Test suite for generate_conversation_summary function."""
+
+    @pytest.mark.asyncio
+    async def test_summarizes_messages_from_given_session(self):
+        """Test that a passed-in session is reused instead of opening a new one."""
+        conversation_id = uuid4()
+        mock_session = MagicMock()
+        mock_session.exec.return_value = [
+            (MessageRole.USER, "What is my life path number?"),
+            (MessageRole.ASSISTANT, "Your Life Path number is 7, the seeker."),
+        ]
+
+        with patch('src.services.conversation_service.Session') as mock_session_class:
+            summary = await generate_conversation_summary(conversation_id, session=mock_session)
+
+            mock_session_class.assert_not_called()
+
+        assert summary["main_topic"] == "Life Path Number"
+        assert summary["key_insights"] == "Your Life Path number is 7, the seeker."
+        assert summary["numbers_discussed"] == "7"
+
+    @pytest.mark.asyncio
+    async def test_given_session_failure_rolls_back_to_savepoint(self):
+        """Test that a failed read on a shared session only unwinds its savepoint."""
+        mock_session = MagicMock()
+        savepoint = mock_session.begin_nested.return_value
+
+        with patch(
+            'src.services.conversation_service._summarize_conversation',
+            side_effect=Exception("query failed")
+        ):
+            summary = await generate_conversation_summary(uuid4(), session=mock_session)
+
+        assert summary["main_topic"] == "General discussion"
+        mock_session.begin_nested.assert_called_once_with()
+        # The savepoint context sees the exception, so it rolls back on exit
+        exit_args = savepoint.__exit__.call_args[0]
+        assert exit_args[0] is Exception
+        mock_session.rollback.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_topic_priority_follows_keyword_order(self):
+        """Test that earlier topics win even when mentioned later in the transcript."""
+        mock_session = MagicMock()
+        mock_session.exec.return_value = [
+            (MessageRole.USER, "Tell me about my soul urge"),
+            (MessageRole.ASSISTANT, "Your soul urge is 22. Your life path is 11 and 3."),
+        ]
+
+        summary = await generate_conversation_summary(uuid4(), session=mock_session)
+
+        assert summary["main_topic"] == "Life Path Number"
+        assert summary["numbers_discussed"] == "3, 11, 22"
+
+    @pytest.mark.asyncio
+    async def test_returns_defaults_when_no_messages(self):
+        """Test default summary for a conversation without messages."""
+        with patch('src.services.conversation_service.Session') as mock_session_class:
+            mock_session = MagicMock()
+            mock_session_class.return_value.__enter__.return_value = mock_session
+            mock_session.exec.return_value = []
+
+            summary = await generate_conversation_summary(uuid4())
+
+        assert summary == {
+            "main_topic": "General discussion",
+            "key_insights": None,
+            "numbers_discussed": None
+        }
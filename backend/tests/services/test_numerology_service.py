@@ -14,10 +14,14 @@ Tests cover:
 
 import pytest
 from datetime import date
+from unittest.mock import patch
 from src.services.numerology_service import (
     _reduce_to_single_digit,
+    _year_digit_sum,
+    _YEAR_DIGIT_SUM,
     calculate_life_path,
     calculate_expression_number,
+    calculate_expression_numbers_batch,
     calculate_soul_urge_number,
     calculate_birthday_number,
     calculate_personal_year,
@@ -122,6 +126,28 @@ def test_calculate_expression_number_case_insensitive():
     assert calculate_expression_number("XYZ") == calculate_expression_number("xyz")
 
 
+def test_calculate_expression_numbers_batch_matches_scalar():
+    """Test that batch results match calculate_expression_number for each name"""
+    names = ["John Smith", "MARY", "Elizabeth Ann-Marie O'Neil", "", "X", "Zzzzzzzzzzzzzzzz"]
+    assert calculate_expression_numbers_batch(names) == [
+        calculate_expression_number(name) for name in names
+    ]
+
+
+def test_calculate_expression_numbers_batch_without_numpy():
+    """Test that batch calculation falls back to the scalar path without numpy"""
+    names = ["John Smith", "MARY"]
+    with patch("src.services.numerology_service.np", None):
+        assert calculate_expression_numbers_batch(names) == [
+            calculate_expression_number(name) for name in names
+        ]
+
+
+def test_calculate_expression_numbers_batch_empty():
+    """Test that an empty batch returns an empty list"""
+    assert calculate_expression_numbers_batch([]) == []
+
+
 # ============================================================================
 # Test Soul Urge Number Calculation
 # ============================================================================
@@ -209,6 +235,25 @@ def test_calculate_personal_year_master_number_result():
     assert 1 <= result <= 9 or result in MASTER_NUMBERS
 
 
+# ============================================================================
+# Test Year Digit Sum Table
+# ============================================================================
+
+def test_year_digit_sum_table_range():
+    """Test that the precomputed table covers 1900-2100 with correct sums"""
+    assert min(_YEAR_DIGIT_SUM) == 1900
+    assert max(_YEAR_DIGIT_SUM) == 2100
+    assert _YEAR_DIGIT_SUM[1990] == 19
+    assert _YEAR_DIGIT_SUM[2025] == 9
+
+
+def test_year_digit_sum_outside_table():
+    """Test that years outside the table fall back to digit summation"""
+    assert _year_digit_sum(1899) == 27
+    assert _year_digit_sum(2101) == 4
+    assert _year_digit_sum(1776) == 21
+
+
 # ============================================================================
 # Test Master Numbers Preservation
 # ============================================================================
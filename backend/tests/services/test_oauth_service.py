@@ -0,0 +1,164 @@
+"""
+Unit tests for OAuth service.
+
+Tests Google ID token verification and the in-process verified-token cache.
+"""
+
+import base64
+import json
+import time
+import pytest
+from unittest.mock import patch
+
+from src.services import oauth_service
+from src.services.oauth_service import (
+    verify_google_token,
+    averify_google_token,
+    clear_token_cache,
+    InvalidTokenError,
+)
+
+
+@pytest.fixture(autouse=True)
+def google_client_id():
+    """Configure a client ID and start every test with an empty token cache."""
+    clear_token_cache()
+    with patch.object(oauth_service.settings, "google_web_client_id", "test-client-id"):
+        yield
+    clear_token_cache()
+
+
+def _b64(data: dict) -> str:
+    return base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b"=").decode()
+
+
+# Structurally valid RS256 JWT (signature checking is mocked in these tests)
+TOKEN = f"{_b64({'alg': 'RS256', 'kid': 'key-1', 'typ': 'JWT'})}.{_b64({'sub': 'x'})}.c2lnbmF0dXJl"
+
+
+def _idinfo(exp_offset: float = 3600) -> dict:
+    return {
+        "sub": "google-user-123",
+        "email": "user@example.com",
+        "name": "Test User",
+        "picture": "https://example.com/p.png",
+        "email_verified": True,
+        "exp": time.time() + exp_offset,
+    }
+
+
+class TestVerifyGoogleToken:
+    """Test suite for verify_google_token."""
+
+    def test_returns_user_info(self):
+        """Test that verified claims are mapped to the user info dict."""
+        with patch("src.services.oauth_service.id_token.verify_oauth2_token", return_value=_idinfo()):
+            result = verify_google_token(TOKEN)
+
+        assert result == {
+            "sub": "google-user-123",
+            "email": "user@example.com",
+            "name": "Test User",
+            "picture": "https://example.com/p.png",
+            "email_verified": True,
+        }
+
+    def test_empty_token_rejected(self):
+        """Test that an empty token raises InvalidTokenError."""
+        with pytest.raises(InvalidTokenError):
+            verify_google_token("")
+
+    @pytest.mark.parametrize("token", [
+        "not-a-jwt",
+        "a.b",
+        "a.b.c.d",
+        "abc.def.gh!",
+        f"{_b64({'alg': 'HS256', 'kid': 'key-1'})}.e30.c2ln",
+        f"{_b64({'alg': 'RS256'})}.e30.c2ln",
+        "bm90anNvbg.e30.c2ln",
+    ])
+    def test_malformed_token_rejected_before_verification(self, token):
+        """Test that structurally invalid tokens never reach signature verification."""
+        with patch("src.services.oauth_service.id_token.verify_oauth2_token") as mock_verify:
+            with pytest.raises(InvalidTokenError):
+                verify_google_token(token)
+
+        mock_verify.assert_not_called()
+
+    def test_invalid_token_raises(self):
+        """Test that a ValueError from google-auth becomes InvalidTokenError."""
+        with patch(
+            "src.services.oauth_service.id_token.verify_oauth2_token",
+            side_effect=ValueError("Wrong number of segments"),
+        ):
+            with pytest.raises(InvalidTokenError):
+                verify_google_token(TOKEN)
+
+
+class TestTokenCache:
+    """Test suite for the verified-token cache."""
+
+    def test_repeat_token_skips_verification(self):
+        """Test that a second call with the same token is served from cache."""
+        with patch(
+            "src.services.oauth_service.id_token.verify_oauth2_token", return_value=_idinfo()
+        ) as mock_verify:
+            first = verify_google_token(TOKEN)
+            second = verify_google_token(TOKEN)
+
+        assert first == second
+        mock_verify.assert_called_once()
+
+    def test_failures_are_not_cached(self):
+        """Test that a failed verification is retried on the next call."""
+        with patch(
+            "src.services.oauth_service.id_token.verify_oauth2_token",
+            side_effect=[ValueError("Invalid signature"), _idinfo()],
+        ) as mock_verify:
+            with pytest.raises(InvalidTokenError):
+                verify_google_token(TOKEN)
+            verify_google_token(TOKEN)
+
+        assert mock_verify.call_count == 2
+
+    def test_expired_token_not_cached(self):
+        """Test that tokens past their exp are never served from cache."""
+        with patch(
+            "src.services.oauth_service.id_token.verify_oauth2_token",
+            return_value=_idinfo(exp_offset=-1),
+        ) as mock_verify:
+            verify_google_token(TOKEN)
+            verify_google_token(TOKEN)
+
+        assert mock_verify.call_count == 2
+
+    def test_clear_token_cache(self):
+        """Test that clearing the cache forces re-verification."""
+        with patch(
+            "src.services.oauth_service.id_token.verify_oauth2_token", return_value=_idinfo()
+        ) as mock_verify:
+            verify_google_token(TOKEN)
+            clear_token_cache()
+            verify_google_token(TOKEN)
+
+        assert mock_verify.call_count == 2
+
+
+class TestAverifyGoogleToken:
+    """Test suite for the async verification wrapper."""
+
+    @pytest.mark.asyncio
+    async def test_runs_verification_off_event_loop(self):
+        """Test that averify_google_token returns the verified user info."""
+        with patch(
+            "src.services.oauth_service.id_token.verify_oauth2_token", return_value=_idinfo()
+        ):
+            result = await averify_google_token(TOKEN)
+
+        assert result["sub"] == "google-user-123"
+
+    @pytest.mark.asyncio
+    async def test_propagates_invalid_token(self):
+        """Test that verification errors propagate to the awaiting caller."""
+        with pytest.raises(InvalidTokenError):
+            await averify_google_token("")
@@ -29,6 +29,17 @@ def test_engine_creation():
     assert str(engine.url).startswith("postgresql://")
 
 
+def test_engine_json_serializer_matches_available_library():
+    """Test that JSON columns use orjson when installed, stdlib json otherwise."""
+    from src.core import database
+
+    if database.orjson is None:
+        assert database._json_options == {}
+    else:
+        assert engine.dialect._json_serializer is database._orjson_serializer
+        assert database._orjson_serializer({1: "a", "b": None}) == '{"1":"a","b":null}'
+
+
 def test_get_session_yields_session():
     """Test that get_session() yields a valid Session."""
     session_generator = get_session()
@@ -4,19 +4,23 @@ Tests for Numerology Function Call Handlers
 Tests all handler functions to ensure they:
 - Convert GPT arguments to proper Python types
 - Call service functions correctly
-- Return GPT-friendly dict results
+- Return GPT-friendly dict results via result_callback
 - Handle errors gracefully without raising exceptions
 - Log execution properly
+
+Handlers are async and report results through params.result_callback. Most
+tests go through handle_numerology_function_sync(), which runs the async
+handlers and returns the captured result dict.
 """
 
+import asyncio
 import pytest
 import sys
 import importlib.util
 from pathlib import Path
-from datetime import date
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
-# Direct module import to avoid triggering voice_pipeline/__init__.py (which imports pipecat)
+# Direct module import to avoid triggering voice_pipeline/__init__.py (which imports the full bot)
 backend_dir = Path(__file__).parent.parent.parent
 module_path = backend_dir / "src" / "voice_pipeline" / "function_handlers.py"
 
@@ -31,6 +35,42 @@ handle_calculate_expression = function_handlers.handle_calculate_expression
 handle_calculate_soul_urge = function_handlers.handle_calculate_soul_urge
 handle_get_interpretation = function_handlers.handle_get_interpretation
 handle_numerology_function = function_handlers.handle_numerology_function
+handle_numerology_function_sync = function_handlers.handle_numerology_function_sync
+
+
+def _mock_session_local(rows):
+    """Build a SessionLocal replacement whose session returns the given rows."""
+    mock_session = MagicMock()
+    mock_session.exec.return_value.all.return_value = rows
+    mock_session_local = Mock()
+    mock_session_local.return_value.__enter__ = Mock(return_value=mock_session)
+    mock_session_local.return_value.__exit__ = Mock(return_value=False)
+    return mock_session_local, mock_session
+
+
+@pytest.fixture(autouse=True)
+def clear_interpretation_cache():
+    """Start every test with an empty interpretation cache."""
+    function_handlers.clear_interpretation_cache()
+    yield
+    function_handlers.clear_interpretation_cache()
+
+
+@pytest.fixture(autouse=True)
+def no_database():
+    """Keep background interpretation prefetches off the real database."""
+    mock_session_local, _ = _mock_session_local([])
+    with patch("function_handlers.SessionLocal", mock_session_local):
+        yield
+
+
+def _make_params(function_name, arguments):
+    """Build a FunctionCallParams-like mock with an async result callback."""
+    params = Mock()
+    params.function_name = function_name
+    params.arguments = arguments
+    params.result_callback = AsyncMock()
+    return params
 
 
 class TestHandleCalculateLifePath:
@@ -38,7 +78,7 @@ class TestHandleCalculateLifePath:
 
     def test_valid_date_returns_life_path_number(self):
         """Test handler with valid date string returns calculated number"""
-        result = handle_calculate_life_path("1990-05-15")
+        result = handle_numerology_function_sync("calculate_life_path", {"birth_date": "1990-05-15"})
 
         assert isinstance(result, dict)
         assert "life_path_number" in result
@@ -47,8 +87,7 @@ class TestHandleCalculateLifePath:
 
     def test_master_number_preserved(self):
         """Test handler preserves master numbers (11, 22, 33)"""
-        # Date that results in master number 11: 1980-02-29
-        result = handle_calculate_life_path("1980-02-29")
+        result = handle_numerology_function_sync("calculate_life_path", {"birth_date": "1980-02-29"})
 
         assert isinstance(result, dict)
         assert "life_path_number" in result
@@ -57,7 +96,7 @@ class TestHandleCalculateLifePath:
 
     def test_invalid_date_format_returns_error_dict(self):
         """Test handler with invalid date format returns error dict (not exception)"""
-        result = handle_calculate_life_path("invalid-date")
+        result = handle_numerology_function_sync("calculate_life_path", {"birth_date": "invalid-date"})
 
         assert isinstance(result, dict)
         assert "error" in result
@@ -65,9 +104,15 @@ class TestHandleCalculateLifePath:
         assert "message" in result
         assert "YYYY-MM-DD" in result["message"]
 
+    def test_impossible_date_returns_error_dict(self):
+        """Test handler rejects well-formed but impossible dates"""
+        result = handle_numerology_function_sync("calculate_life_path", {"birth_date": "1990-02-30"})
+
+        assert result["error"] == "InvalidDate"
+
     def test_empty_date_returns_error_dict(self):
         """Test handler with empty date returns error dict"""
-        result = handle_calculate_life_path("")
+        result = handle_numerology_function_sync("calculate_life_path", {"birth_date": ""})
 
         assert isinstance(result, dict)
         assert "error" in result
@@ -75,7 +120,7 @@ class TestHandleCalculateLifePath:
 
     def test_partial_date_returns_error_dict(self):
         """Test handler with partial date (e.g., missing day) returns error"""
-        result = handle_calculate_life_path("1990-05")
+        result = handle_numerology_function_sync("calculate_life_path", {"birth_date": "1990-05"})
 
         assert isinstance(result, dict)
         assert "error" in result
@@ -84,19 +129,34 @@ class TestHandleCalculateLifePath:
         """Test handler catches all exceptions and returns error dict"""
         # Even with completely malformed input, should not raise
         try:
-            result = handle_calculate_life_path(None)
+            result = handle_numerology_function_sync("calculate_life_path", {"birth_date": None})
             assert isinstance(result, dict)
             assert "error" in result
         except Exception:
             pytest.fail("Handler should not raise exceptions")
 
+    @pytest.mark.asyncio
+    async def test_result_delivered_via_callback_with_run_llm(self):
+        """Test async handler reports its result through result_callback"""
+        params = _make_params("calculate_life_path", {"birth_date": "1990-05-15"})
+
+        await handle_calculate_life_path(params)
+
+        params.result_callback.assert_awaited_once()
+        result = params.result_callback.call_args[0][0]
+        properties = params.result_callback.call_args[1]["properties"]
+        assert "life_path_number" in result
+        assert properties.run_llm is True
+
 
 class TestHandleCalculateExpression:
     """Test Expression number calculation handler (AC3)"""
 
     def test_valid_name_returns_expression_number(self):
         """Test handler with valid name returns calculated number"""
-        result = handle_calculate_expression("John Michael Smith")
+        result = handle_numerology_function_sync(
+            "calculate_expression_number", {"full_name": "John Michael Smith"}
+        )
 
         assert isinstance(result, dict)
         assert "expression_number" in result
@@ -105,7 +165,7 @@ class TestHandleCalculateExpression:
 
     def test_empty_name_returns_error_dict(self):
         """Test handler with empty name returns error dict"""
-        result = handle_calculate_expression("")
+        result = handle_numerology_function_sync("calculate_expression_number", {"full_name": ""})
 
         assert isinstance(result, dict)
         assert "error" in result
@@ -115,7 +175,7 @@ class TestHandleCalculateExpression:
 
     def test_whitespace_only_name_returns_error_dict(self):
         """Test handler with whitespace-only name returns error"""
-        result = handle_calculate_expression("   ")
+        result = handle_numerology_function_sync("calculate_expression_number", {"full_name": "   "})
 
         assert isinstance(result, dict)
         assert "error" in result
@@ -123,25 +183,36 @@ class TestHandleCalculateExpression:
 
     def test_single_name_works(self):
         """Test handler works with single name (edge case)"""
-        result = handle_calculate_expression("Madonna")
+        result = handle_numerology_function_sync("calculate_expression_number", {"full_name": "Madonna"})
 
         assert isinstance(result, dict)
         assert "expression_number" in result
 
     def test_name_with_special_characters_works(self):
         """Test handler works with names containing hyphens, apostrophes"""
-        result = handle_calculate_expression("Mary-Jane O'Connor")
+        result = handle_numerology_function_sync(
+            "calculate_expression_number", {"full_name": "Mary-Jane O'Connor"}
+        )
 
         assert isinstance(result, dict)
         assert "expression_number" in result
 
+    def test_case_and_whitespace_do_not_change_result(self):
+        """Test normalized names give the same number as the original"""
+        first = handle_numerology_function_sync("calculate_expression_number", {"full_name": "John Smith"})
+        second = handle_numerology_function_sync("calculate_expression_number", {"full_name": "  JOHN SMITH "})
+
+        assert first == second
+
 
 class TestHandleCalculateSoulUrge:
     """Test Soul Urge number calculation handler (AC4)"""
 
     def test_valid_name_returns_soul_urge_number(self):
         """Test handler with valid name returns calculated number"""
-        result = handle_calculate_soul_urge("Sarah Elizabeth Johnson")
+        result = handle_numerology_function_sync(
+            "calculate_soul_urge_number", {"full_name": "Sarah Elizabeth Johnson"}
+        )
 
         assert isinstance(result, dict)
         assert "soul_urge_number" in result
@@ -150,7 +221,7 @@ class TestHandleCalculateSoulUrge:
 
     def test_empty_name_returns_error_dict(self):
         """Test handler with empty name returns error dict"""
-        result = handle_calculate_soul_urge("")
+        result = handle_numerology_function_sync("calculate_soul_urge_number", {"full_name": ""})
 
         assert isinstance(result, dict)
         assert "error" in result
@@ -158,7 +229,7 @@ class TestHandleCalculateSoulUrge:
 
     def test_whitespace_only_name_returns_error_dict(self):
         """Test handler with whitespace-only name returns error"""
-        result = handle_calculate_soul_urge("   \t\n   ")
+        result = handle_numerology_function_sync("calculate_soul_urge_number", {"full_name": "   \t\n   "})
 
         assert isinstance(result, dict)
         assert "error" in result
@@ -169,30 +240,33 @@ class TestHandleGetInterpretation:
 
     def test_valid_parameters_returns_interpretations(self):
         """Test handler with valid parameters returns interpretation list"""
-        result = handle_get_interpretation(
-            number_type="life_path",
-            number_value=1
-        )
-
-        assert isinstance(result, dict)
-        assert "interpretations" in result
-        assert isinstance(result["interpretations"], list)
+        mock_session_local, _ = _mock_session_local([
+            ("personality", "Natural born leader..."),
+            ("strengths", "Independence..."),
+        ])
+
+        with patch("function_handlers.SessionLocal", mock_session_local):
+            result = handle_numerology_function_sync(
+                "get_numerology_interpretation",
+                {"number_type": "life_path", "number_value": 1}
+            )
 
-        # If interpretations exist, verify structure
-        if len(result["interpretations"]) > 0:
-            interp = result["interpretations"][0]
-            assert "category" in interp
-            assert "content" in interp
-            assert isinstance(interp["category"], str)
-            assert isinstance(interp["content"], str)
+        assert result == {
+            "interpretations": [
+                {"category": "personality", "content": "Natural born leader..."},
+                {"category": "strengths", "content": "Independence..."},
+            ]
+        }
 
     def test_with_category_filter_returns_filtered_results(self):
         """Test handler with category filter returns only matching category"""
-        result = handle_get_interpretation(
-            number_type="life_path",
-            number_value=1,
-            category="personality"
-        )
+        mock_session_local, _ = _mock_session_local([("personality", "Natural born leader...")])
+
+        with patch("function_handlers.SessionLocal", mock_session_local):
+            result = handle_numerology_function_sync(
+                "get_numerology_interpretation",
+                {"number_type": "life_path", "number_value": 1, "category": "personality"}
+            )
 
         assert isinstance(result, dict)
         assert "interpretations" in result
@@ -202,48 +276,135 @@ class TestHandleGetInterpretation:
             assert interp["category"] == "personality"
 
     def test_nonexistent_number_returns_empty_list_not_error(self):
-        """Test handler with non-existent number returns empty list (not error)"""
-        result = handle_get_interpretation(
-            number_type="life_path",
-            number_value=999  # Non-existent value
-        )
+        """Test handler with non-existent number returns empty list without querying"""
+        mock_session_local, _ = _mock_session_local([])
 
-        assert isinstance(result, dict)
-        assert "interpretations" in result
-        assert isinstance(result["interpretations"], list)
-        # Should return empty list, not error
-        assert "error" not in result
+        with patch("function_handlers.SessionLocal", mock_session_local):
+            result = handle_numerology_function_sync(
+                "get_numerology_interpretation",
+                {"number_type": "life_path", "number_value": 999}  # Non-existent value
+            )
+
+        assert result == {"interpretations": []}
+        mock_session_local.assert_not_called()
+
+    def test_unknown_number_type_returns_empty_list_without_query(self):
+        """Test handler short-circuits hallucinated number types"""
+        mock_session_local, _ = _mock_session_local([])
+
+        with patch("function_handlers.SessionLocal", mock_session_local):
+            result = handle_numerology_function_sync(
+                "get_numerology_interpretation",
+                {"number_type": "destiny", "number_value": 1}
+            )
+
+        assert result == {"interpretations": []}
+        mock_session_local.assert_not_called()
 
     def test_master_number_interpretations_exist(self):
         """Test handler can retrieve master number interpretations (11, 22, 33)"""
-        for master_num in [11, 22, 33]:
-            result = handle_get_interpretation(
-                number_type="life_path",
-                number_value=master_num
+        mock_session_local, _ = _mock_session_local([("personality", "Master number...")])
+
+        with patch("function_handlers.SessionLocal", mock_session_local):
+            for master_num in [11, 22, 33]:
+                result = handle_numerology_function_sync(
+                    "get_numerology_interpretation",
+                    {"number_type": "life_path", "number_value": master_num}
+                )
+
+                assert isinstance(result, dict)
+                assert "interpretations" in result
+                assert isinstance(result["interpretations"], list)
+
+    def test_category_filter_applied_to_cached_rows(self):
+        """Test category lookups share one cached query and filter in memory"""
+        mock_session_local, _ = _mock_session_local([
+            ("personality", "Natural born leader..."),
+            ("strengths", "Independence..."),
+        ])
+
+        with patch("function_handlers.SessionLocal", mock_session_local):
+            personality = handle_numerology_function_sync(
+                "get_numerology_interpretation",
+                {"number_type": "life_path", "number_value": 1, "category": "personality"}
+            )
+            strengths = handle_numerology_function_sync(
+                "get_numerology_interpretation",
+                {"number_type": "life_path", "number_value": 1, "category": "strengths"}
             )
 
-            assert isinstance(result, dict)
-            assert "interpretations" in result
-            # Master numbers may or may not have interpretations yet, but should return valid structure
-            assert isinstance(result["interpretations"], list)
+        assert personality == {
+            "interpretations": [{"category": "personality", "content": "Natural born leader..."}]
+        }
+        assert strengths == {
+            "interpretations": [{"category": "strengths", "content": "Independence..."}]
+        }
+        mock_session_local.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_calculation_prefetches_interpretations(self):
+        """Test a calculation warms the cache for the follow-up interpretation call"""
+        mock_session_local, _ = _mock_session_local([("personality", "Natural born leader...")])
+
+        with patch("function_handlers.SessionLocal", mock_session_local):
+            calc_params = _make_params("calculate_life_path", {"birth_date": "1990-05-15"})
+            await handle_calculate_life_path(calc_params)
+            life_path = calc_params.result_callback.call_args[0][0]["life_path_number"]
+
+            # Let the background prefetch finish
+            await asyncio.gather(*function_handlers._prefetch_tasks)
+            mock_session_local.assert_called_once()
+
+            interp_params = _make_params(
+                "get_numerology_interpretation",
+                {"number_type": "life_path", "number_value": life_path}
+            )
+            await handle_get_interpretation(interp_params)
+
+        # Served from the prefetched cache entry - no second query
+        mock_session_local.assert_called_once()
+        assert interp_params.result_callback.call_args[0][0] == {
+            "interpretations": [{"category": "personality", "content": "Natural born leader..."}]
+        }
+
+    def test_sync_shim_skips_prefetch(self):
+        """Test sync callers do not pay for a prefetch their loop would discard"""
+        mock_session_local, _ = _mock_session_local([("personality", "Natural born leader...")])
+
+        with patch("function_handlers.SessionLocal", mock_session_local):
+            result = handle_numerology_function_sync("calculate_life_path", {"birth_date": "1990-05-15"})
+
+        assert "life_path_number" in result
+        mock_session_local.assert_not_called()
+
+    def test_repeat_lookup_served_from_cache(self):
+        """Test the same lookup only queries the database once"""
+        mock_session_local, _ = _mock_session_local([("personality", "Natural born leader...")])
+        arguments = {"number_type": "life_path", "number_value": 1}
+
+        with patch("function_handlers.SessionLocal", mock_session_local):
+            first = handle_numerology_function_sync("get_numerology_interpretation", arguments)
+            second = handle_numerology_function_sync("get_numerology_interpretation", arguments)
+
+        assert first == second
+        mock_session_local.assert_called_once()
 
     def test_database_error_returns_error_dict(self):
         """Test handler returns error dict on database failure"""
-        # Mock database failure by mocking the Session context manager
-        with patch('function_handlers.Session') as mock_session_class:
-            mock_session = Mock()
-            mock_session.__enter__ = Mock(side_effect=Exception("Database connection failed"))
-            mock_session.__exit__ = Mock(return_value=False)
-            mock_session_class.return_value = mock_session
-
-            result = handle_get_interpretation(
-                number_type="life_path",
-                number_value=1
+        # Mock database failure by mocking the session context manager
+        mock_session_local = Mock()
+        mock_session_local.return_value.__enter__ = Mock(side_effect=Exception("Database connection failed"))
+        mock_session_local.return_value.__exit__ = Mock(return_value=False)
+
+        with patch("function_handlers.SessionLocal", mock_session_local):
+            result = handle_numerology_function_sync(
+                "get_numerology_interpretation",
+                {"number_type": "life_path", "number_value": 1}
             )
 
-            assert isinstance(result, dict)
-            assert "error" in result
-            assert result["error"] == "DatabaseError"
+        assert isinstance(result, dict)
+        assert "error" in result
+        assert result["error"] == "DatabaseError"
 
 
 class TestHandleNumerologyFunction:
@@ -252,54 +413,59 @@ class TestHandleNumerologyFunction:
     def test_calculate_life_path_routing(self):
         """Test router dispatches calculate_life_path correctly"""
         arguments = {"birth_date": "1990-05-15"}
-        result = handle_numerology_function("calculate_life_path", arguments)
+        result = handle_numerology_function_sync("calculate_life_path", arguments)
 
         assert isinstance(result, dict)
-        # Should have life_path_number or error
-        assert "life_path_number" in result or "error" in result
+        assert "life_path_number" in result
 
     def test_calculate_expression_number_routing(self):
         """Test router dispatches calculate_expression_number correctly"""
         arguments = {"full_name": "John Smith"}
-        result = handle_numerology_function("calculate_expression_number", arguments)
+        result = handle_numerology_function_sync("calculate_expression_number", arguments)
 
         assert isinstance(result, dict)
-        assert "expression_number" in result or "error" in result
+        assert "expression_number" in result
 
     def test_calculate_soul_urge_number_routing(self):
         """Test router dispatches calculate_soul_urge_number correctly"""
         arguments = {"full_name": "Jane Doe"}
-        result = handle_numerology_function("calculate_soul_urge_number", arguments)
+        result = handle_numerology_function_sync("calculate_soul_urge_number", arguments)
 
         assert isinstance(result, dict)
-        assert "soul_urge_number" in result or "error" in result
+        assert "soul_urge_number" in result
 
     def test_get_numerology_interpretation_routing(self):
         """Test router dispatches get_numerology_interpretation correctly"""
+        mock_session_local, _ = _mock_session_local([])
         arguments = {
             "number_type": "life_path",
             "number_value": 1
         }
-        result = handle_numerology_function("get_numerology_interpretation", arguments)
+
+        with patch("function_handlers.SessionLocal", mock_session_local):
+            result = handle_numerology_function_sync("get_numerology_interpretation", arguments)
 
         assert isinstance(result, dict)
-        assert "interpretations" in result or "error" in result
+        assert "interpretations" in result
 
     def test_get_interpretation_with_optional_category(self):
         """Test router handles optional category parameter"""
+        mock_session_local, _ = _mock_session_local([])
         arguments = {
             "number_type": "life_path",
             "number_value": 1,
             "category": "personality"
         }
-        result = handle_numerology_function("get_numerology_interpretation", arguments)
+
+        with patch("function_handlers.SessionLocal", mock_session_local):
+            result = handle_numerology_function_sync("get_numerology_interpretation", arguments)
 
         assert isinstance(result, dict)
-        assert "interpretations" in result or "error" in result
+        assert "interpretations" in result
 
     def test_unknown_function_name_returns_error(self):
         """Test router returns error for unknown function names"""
-        result = handle_numerology_function("unknown_function", {})
+        result = handle_numerology_function_sync("unknown_function", {})
 
         assert isinstance(result, dict)
         assert "error" in result
@@ -308,7 +474,7 @@ class TestHandleNumerologyFunction:
 
     def test_missing_required_argument_returns_error(self):
         """Test router returns error when required argument missing"""
-        result = handle_numerology_function("calculate_life_path", {})
+        result = handle_numerology_function_sync("calculate_life_path", {})
 
         assert isinstance(result, dict)
         assert "error" in result
@@ -318,12 +484,22 @@ class TestHandleNumerologyFunction:
         """Test router catches all exceptions and returns error dict"""
         try:
             # Invalid arguments should return error dict, not raise
-            result = handle_numerology_function("calculate_life_path", {"wrong_key": "value"})
+            result = handle_numerology_function_sync("calculate_life_path", {"wrong_key": "value"})
             assert isinstance(result, dict)
             assert "error" in result
         except Exception:
             pytest.fail("Router should not raise exceptions")
 
+    @pytest.mark.asyncio
+    async def test_async_router_uses_result_callback(self):
+        """Test router can be awaited directly from the voice pipeline"""
+        params = _make_params("calculate_expression_number", {"full_name": "John Smith"})
+
+        await handle_numerology_function(params)
+
+        params.result_callback.assert_awaited_once()
+        assert "expression_number" in params.result_callback.call_args[0][0]
+
 
 class TestErrorHandling:
     """Test comprehensive error handling across all handlers (AC7)"""
@@ -331,42 +507,41 @@ class TestErrorHandling:
     def test_all_handlers_return_dict_never_raise(self):
         """Test all handlers always return dict, never raise exceptions"""
         test_cases = [
-            (handle_calculate_life_path, ["invalid"]),
-            (handle_calculate_expression, [""]),
-            (handle_calculate_soul_urge, [""]),
-            (handle_get_interpretation, ["invalid_type", 999]),
-            (handle_numerology_function, ["unknown", {}]),
+            ("calculate_life_path", {"birth_date": "invalid"}),
+            ("calculate_expression_number", {"full_name": ""}),
+            ("calculate_soul_urge_number", {"full_name": ""}),
+            ("get_numerology_interpretation", {"number_type": "invalid_type", "number_value": 999}),
+            ("unknown", {}),
         ]
 
-        for handler, args in test_cases:
+        for function_name, arguments in test_cases:
             try:
-                result = handler(*args)
-                assert isinstance(result, dict), f"{handler.__name__} did not return dict"
+                result = handle_numerology_function_sync(function_name, arguments)
+                assert isinstance(result, dict), f"{function_name} did not return dict"
             except Exception as e:
-                pytest.fail(f"{handler.__name__} raised exception: {e}")
+                pytest.fail(f"{function_name} raised exception: {e}")
 
     def test_error_dicts_have_consistent_format(self):
         """Test all error dicts have 'error' and 'message' keys"""
         # Generate various errors
         error_results = [
-            handle_calculate_life_path("invalid"),
-            handle_calculate_expression(""),
-            handle_calculate_soul_urge(""),
-            handle_numerology_function("unknown", {}),
-            handle_numerology_function("calculate_life_path", {}),
+            handle_numerology_function_sync("calculate_life_path", {"birth_date": "invalid"}),
+            handle_numerology_function_sync("calculate_expression_number", {"full_name": ""}),
+            handle_numerology_function_sync("calculate_soul_urge_number", {"full_name": ""}),
+            handle_numerology_function_sync("unknown", {}),
+            handle_numerology_function_sync("calculate_life_path", {}),
         ]
 
         for result in error_results:
-            if "error" in result:  # It's an error dict
-                assert "error" in result, "Error dict missing 'error' key"
-                assert "message" in result, "Error dict missing 'message' key"
-                assert isinstance(result["error"], str), "'error' should be string"
-                assert isinstance(result["message"], str), "'message' should be string"
-                assert len(result["message"]) > 0, "Error message should not be empty"
+            assert "error" in result, "Error dict missing 'error' key"
+            assert "message" in result, "Error dict missing 'message' key"
+            assert isinstance(result["error"], str), "'error' should be string"
+            assert isinstance(result["message"], str), "'message' should be string"
+            assert len(result["message"]) > 0, "Error message should not be empty"
 
     def test_error_messages_are_user_friendly(self):
         """Test error messages don't expose internal implementation details"""
-        result = handle_calculate_life_path("invalid")
+        result = handle_numerology_function_sync("calculate_life_path", {"birth_date": "invalid"})
 
         assert "error" in result
         # Should not contain technical terms like "ValueError", "strptime", etc.
@@ -386,7 +561,7 @@ class TestIntegration:
         arguments = {"birth_date": "1990-05-15"}
 
         # Call router (as Pipecat would)
-        result = handle_numerology_function(function_name, arguments)
+        result = handle_numerology_function_sync(function_name, arguments)
 
         # Verify success
         assert isinstance(result, dict)
@@ -396,7 +571,7 @@ class TestIntegration:
     def test_full_interpretation_flow(self):
         """Test complete interpretation retrieval flow"""
         # First calculate a number
-        calc_result = handle_numerology_function(
+        calc_result = handle_numerology_function_sync(
             "calculate_life_path",
             {"birth_date": "1990-05-15"}
         )
@@ -404,20 +579,22 @@ class TestIntegration:
 
         # Then get interpretations for that number
         life_path = calc_result["life_path_number"]
-        interp_result = handle_numerology_function(
-            "get_numerology_interpretation",
-            {
-                "number_type": "life_path",
-                "number_value": life_path
-            }
-        )
+        mock_session_local, _ = _mock_session_local([("personality", "Creative communicator...")])
+        with patch("function_handlers.SessionLocal", mock_session_local):
+            interp_result = handle_numerology_function_sync(
+                "get_numerology_interpretation",
+                {
+                    "number_type": "life_path",
+                    "number_value": life_path
+                }
+            )
 
         assert "interpretations" in interp_result
         assert isinstance(interp_result["interpretations"], list)
 
     def test_error_flow_invalid_input(self):
         """Test error handling in full flow with invalid input"""
-        result = handle_numerology_function(
+        result = handle_numerology_function_sync(
             "calculate_life_path",
             {"birth_date": "not-a-date"}
         )
@@ -428,7 +605,7 @@ class TestIntegration:
 
     def test_error_flow_missing_argument(self):
         """Test error handling when argument missing"""
-        result = handle_numerology_function(
+        result = handle_numerology_function_sync(
             "calculate_expression_number",
             {}  # Missing full_name
         )
@@ -444,24 +621,37 @@ class TestLogging:
     @patch('function_handlers.logger')
     def test_successful_execution_logged_info(self, mock_logger):
         """Test successful executions logged at INFO level"""
-        handle_calculate_life_path("1990-05-15")
+        handle_numerology_function_sync("calculate_life_path", {"birth_date": "1990-05-15"})
 
         # Should have INFO logs for start and success
         assert mock_logger.info.called
         assert mock_logger.info.call_count >= 2
 
     @patch('function_handlers.logger')
-    def test_error_execution_logged_error(self, mock_logger):
-        """Test failed executions logged at ERROR level"""
-        handle_calculate_life_path("invalid-date")
+    def test_invalid_input_logged_warning_without_traceback(self, mock_logger):
+        """Test expected bad input is logged at WARNING level without exc_info"""
+        handle_numerology_function_sync("calculate_life_path", {"birth_date": "invalid-date"})
+
+        # Should have WARNING log, no ERROR/traceback for expected input errors
+        assert mock_logger.warning.called
+        assert "exc_info" not in mock_logger.warning.call_args[1]
+        assert not mock_logger.error.called
+
+    @patch('function_handlers.logger')
+    def test_unexpected_error_logged_error(self, mock_logger):
+        """Test unexpected failures are logged at ERROR level with traceback"""
+        with patch("function_handlers._life_path_cached", side_effect=RuntimeError("boom")):
+            handle_numerology_function_sync("calculate_life_path", {"birth_date": "1990-05-15"})
 
-        # Should have ERROR log
+        # Should have ERROR log with traceback
         assert mock_logger.error.called
+        assert mock_logger.error.call_args[1].get("exc_info") is True
 
     @patch('function_handlers.logger')
     def test_router_logs_function_calls(self, mock_logger):
         """Test router logs all function calls"""
-        handle_numerology_function("calculate_life_path", {"birth_date": "1990-05-15"})
+        mock_logger.isEnabledFor.return_value = True
+        handle_numerology_function_sync("calculate_life_path", {"birth_date": "1990-05-15"})
 
         # Router should log the function call
         assert mock_logger.info.called
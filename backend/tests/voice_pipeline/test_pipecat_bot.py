@@ -15,12 +15,22 @@ Note: Deep integration tests with Pipecat mocking are avoided due to Pydantic
       Manual E2E testing validates the complete pipeline.
 """
 
+import asyncio
+
 import pytest
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 from src.voice_pipeline import pipecat_bot
 
 
+@pytest.fixture(autouse=True)
+def reset_config_validation():
+    """Re-run configuration validation in every test (tests patch settings)."""
+    pipecat_bot._reset_config_validation()
+    yield
+    pipecat_bot._reset_config_validation()
+
+
 # ============================================================================
 # Configuration Validation Tests
 # ============================================================================
@@ -135,6 +145,561 @@ def test_validate_configuration_error_messages_helpful():
         assert "portal.azure.com" in error_message or "Speech Services" in error_message
 
 
+def test_validate_configuration_runs_once_after_success():
+    """Test that a successful validation is not repeated for later sessions"""
+    with patch("src.voice_pipeline.pipecat_bot.settings") as mock_settings:
+        mock_settings.azure_speech_api_key = "test-key"
+        mock_settings.azure_openai_api_key = "test-key"
+        mock_settings.azure_openai_endpoint = "https://test.com"
+        mock_settings.elevenlabs_api_key = "test-key"
+        pipecat_bot._validate_configuration()
+
+    with patch("src.voice_pipeline.pipecat_bot._BotConfig.from_settings") as mock_snapshot:
+        pipecat_bot._validate_configuration()
+
+    mock_snapshot.assert_not_called()
+
+
+def test_failed_validation_is_retried():
+    """Test that a failed validation does not mark configuration as valid"""
+    with patch("src.voice_pipeline.pipecat_bot.settings") as mock_settings:
+        mock_settings.azure_speech_api_key = ""
+        mock_settings.azure_openai_api_key = "test-key"
+        mock_settings.azure_openai_endpoint = "https://test.com"
+        mock_settings.elevenlabs_api_key = "test-key"
+
+        with pytest.raises(ValueError):
+            pipecat_bot._validate_configuration()
+        with pytest.raises(ValueError):
+            pipecat_bot._validate_configuration()
+
+
+def test_bot_config_snapshots_settings():
+    """Test that _BotConfig copies settings into an immutable snapshot"""
+    with patch("src.voice_pipeline.pipecat_bot.settings") as mock_settings:
+        mock_settings.azure_speech_api_key = "speech-key"
+        mock_settings.voice_language = "vi"
+
+        config = pipecat_bot._BotConfig.from_settings()
+        mock_settings.azure_speech_api_key = "changed"
+
+    assert config.azure_speech_api_key == "speech-key"
+    assert config.voice_language == "vi"
+    with pytest.raises(AttributeError):
+        config.voice_language = "en"
+
+
+def test_validate_configuration_uses_given_snapshot():
+    """Test that an explicit config snapshot is validated instead of settings"""
+    with patch("src.voice_pipeline.pipecat_bot.settings") as mock_settings:
+        mock_settings.azure_speech_api_key = "test-key"
+        mock_settings.azure_openai_api_key = "test-key"
+        mock_settings.azure_openai_endpoint = "https://test.com"
+        mock_settings.elevenlabs_api_key = "test-key"
+        config = pipecat_bot._BotConfig.from_settings()
+
+    with patch("src.voice_pipeline.pipecat_bot.settings") as mock_settings:
+        mock_settings.elevenlabs_api_key = ""
+
+        # Should not raise: the snapshot has every key configured
+        pipecat_bot._validate_configuration(config)
+
+
+# ============================================================================
+# Conversation Context Loading Tests
+# ============================================================================
+
+@pytest.mark.asyncio
+async def test_load_conversation_context_skips_non_vietnamese():
+    """Test that no history is fetched when the prompt does not use it"""
+    with patch(
+        "src.services.conversation_service.get_conversation_context_cached",
+        new_callable=AsyncMock,
+    ) as mock_cached:
+        assert await pipecat_bot._load_conversation_context(Mock(), "en") is None
+        mock_cached.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_load_conversation_context_skips_without_user():
+    """Test that anonymous sessions do not fetch history"""
+    assert await pipecat_bot._load_conversation_context(None, "vi") is None
+
+
+@pytest.mark.asyncio
+async def test_load_conversation_context_fetches_cached_history():
+    """Test that Vietnamese sessions load the cached conversation context"""
+    user = Mock()
+    with patch(
+        "src.services.conversation_service.get_conversation_context_cached",
+        new_callable=AsyncMock,
+        return_value="history",
+    ) as mock_cached:
+        assert await pipecat_bot._load_conversation_context(user, "vi") == "history"
+        mock_cached.assert_awaited_once_with(user.id)
+
+
+# ============================================================================
+# Function Registration Table Tests
+# ============================================================================
+
+def test_numerology_functions_match_tool_schemas():
+    """Test every tool offered to the LLM has exactly one registered handler"""
+    from src.voice_pipeline.numerology_functions import numerology_tools
+
+    registered = [name for name, _ in pipecat_bot._FUNCTION_HANDLERS]
+    offered = [tool["function"]["name"] for tool in numerology_tools]
+
+    assert sorted(registered) == sorted(offered)
+    assert len(set(registered)) == len(registered)
+
+
+# ============================================================================
+# Startup Failure Tests
+# ============================================================================
+
+@pytest.mark.asyncio
+async def test_run_bot_startup_failure_cancels_context_fetch():
+    """Test a VAD load failure cancels the context fetch and surfaces the error"""
+    context_cancelled = asyncio.Event()
+
+    async def slow_context(user, voice_language):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            context_cancelled.set()
+            raise
+
+    with patch("src.voice_pipeline.pipecat_bot.settings") as mock_settings, \
+         patch(
+             "src.voice_pipeline.pipecat_bot.SileroVADAnalyzer",
+             side_effect=RuntimeError("model missing"),
+         ), \
+         patch("src.voice_pipeline.pipecat_bot._load_conversation_context", slow_context):
+        mock_settings.azure_speech_api_key = "test-key"
+        mock_settings.azure_openai_api_key = "test-key"
+        mock_settings.azure_openai_endpoint = "https://test.com"
+        mock_settings.elevenlabs_api_key = "test-key"
+
+        with pytest.raises(pipecat_bot.PipecatBotError) as exc_info:
+            await asyncio.wait_for(pipecat_bot.run_bot("https://room", "token"), timeout=5)
+
+    assert "RuntimeError: model missing" in str(exc_info.value)
+    assert context_cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_run_bot_pipeline_build_failure_starts_no_message_writer():
+    """Test a failure while building the pipeline leaves no writer task behind"""
+    from uuid import uuid4
+
+    async def no_context(user, voice_language):
+        return None
+
+    with patch("src.voice_pipeline.pipecat_bot.settings") as mock_settings, \
+         patch("src.voice_pipeline.pipecat_bot.SileroVADAnalyzer"), \
+         patch("src.voice_pipeline.pipecat_bot._load_conversation_context", no_context), \
+         patch("src.voice_pipeline.pipecat_bot.DailyParams"), \
+         patch("src.voice_pipeline.pipecat_bot.DailyTransport"), \
+         patch("src.voice_pipeline.pipecat_bot.AzureSTTService"), \
+         patch("src.voice_pipeline.pipecat_bot._SharedClientAzureLLMService"), \
+         patch("src.voice_pipeline.pipecat_bot.ElevenLabsTTSService"), \
+         patch("src.voice_pipeline.pipecat_bot.Pipeline", side_effect=RuntimeError("bad pipeline")), \
+         patch("src.voice_pipeline.pipecat_bot._MessageWriter") as mock_writer_class:
+        mock_settings.azure_speech_api_key = "test-key"
+        mock_settings.azure_openai_api_key = "test-key"
+        mock_settings.azure_openai_endpoint = "https://test.com"
+        mock_settings.elevenlabs_api_key = "test-key"
+        mock_settings.elevenlabs_http_streaming = False
+        mock_settings.voice_language = "en"
+
+        with pytest.raises(pipecat_bot.PipecatBotError):
+            await pipecat_bot.run_bot("https://room", "token", conversation_id=uuid4())
+
+    mock_writer_class.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_run_bot_pipeline_value_error_logs_traceback():
+    """Test a ValueError from inside the pipeline is not reported as a configuration error"""
+    async def no_context(user, voice_language):
+        return None
+
+    with patch("src.voice_pipeline.pipecat_bot.settings") as mock_settings, \
+         patch("src.voice_pipeline.pipecat_bot.SileroVADAnalyzer"), \
+         patch("src.voice_pipeline.pipecat_bot._load_conversation_context", no_context), \
+         patch("src.voice_pipeline.pipecat_bot.DailyParams"), \
+         patch("src.voice_pipeline.pipecat_bot.DailyTransport"), \
+         patch("src.voice_pipeline.pipecat_bot.AzureSTTService"), \
+         patch("src.voice_pipeline.pipecat_bot._SharedClientAzureLLMService"), \
+         patch("src.voice_pipeline.pipecat_bot.ElevenLabsTTSService"), \
+         patch("src.voice_pipeline.pipecat_bot.Pipeline", side_effect=ValueError("bad frame")), \
+         patch("src.voice_pipeline.pipecat_bot.logger") as mock_logger:
+        mock_settings.azure_speech_api_key = "test-key"
+        mock_settings.azure_openai_api_key = "test-key"
+        mock_settings.azure_openai_endpoint = "https://test.com"
+        mock_settings.elevenlabs_api_key = "test-key"
+        mock_settings.elevenlabs_http_streaming = False
+        mock_settings.voice_language = "en"
+
+        with pytest.raises(pipecat_bot.PipecatBotError) as exc_info:
+            await pipecat_bot.run_bot("https://room", "token")
+
+    assert "ValueError: bad frame" in str(exc_info.value)
+    mock_logger.error.assert_called_once()
+    assert mock_logger.error.call_args.kwargs.get("exc_info") is True
+
+
+@pytest.mark.asyncio
+async def test_run_bot_missing_keys_raises_configuration_error():
+    """Test missing API keys surface as ConfigurationError without a traceback"""
+    with patch("src.voice_pipeline.pipecat_bot.settings") as mock_settings, \
+         patch("src.voice_pipeline.pipecat_bot.logger") as mock_logger:
+        mock_settings.azure_speech_api_key = ""
+        mock_settings.azure_openai_api_key = "test-key"
+        mock_settings.azure_openai_endpoint = "https://test.com"
+        mock_settings.elevenlabs_api_key = "test-key"
+
+        with pytest.raises(pipecat_bot.ConfigurationError):
+            await pipecat_bot.run_bot("https://room", "token")
+
+    mock_logger.error.assert_called_once()
+    assert "exc_info" not in mock_logger.error.call_args.kwargs
+
+
+@pytest.mark.asyncio
+async def test_run_bot_cancellation_propagates_without_error_log():
+    """Test cancelling a bot re-raises CancelledError and logs no error"""
+    started = asyncio.Event()
+
+    async def blocking_context(user, voice_language):
+        started.set()
+        await asyncio.sleep(10)
+
+    with patch("src.voice_pipeline.pipecat_bot.settings") as mock_settings, \
+         patch("src.voice_pipeline.pipecat_bot.SileroVADAnalyzer"), \
+         patch("src.voice_pipeline.pipecat_bot._load_conversation_context", blocking_context), \
+         patch("src.voice_pipeline.pipecat_bot.logger") as mock_logger:
+        mock_settings.azure_speech_api_key = "test-key"
+        mock_settings.azure_openai_api_key = "test-key"
+        mock_settings.azure_openai_endpoint = "https://test.com"
+        mock_settings.elevenlabs_api_key = "test-key"
+
+        bot = asyncio.create_task(pipecat_bot.run_bot("https://room", "token"))
+        await started.wait()
+        bot.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await bot
+
+    mock_logger.error.assert_not_called()
+
+
+# ============================================================================
+# Shared Azure OpenAI Client Tests
+# ============================================================================
+
+@pytest.fixture
+def shared_clients():
+    """Isolate the shared client registry for each test."""
+    pipecat_bot._azure_openai_clients.clear()
+    yield pipecat_bot._azure_openai_clients
+    pipecat_bot._azure_openai_clients.clear()
+
+
+@pytest.mark.asyncio
+async def test_azure_openai_client_reused_for_same_settings(shared_clients):
+    """Test sessions with the same settings share one client"""
+    first = pipecat_bot._get_azure_openai_client("key", "https://test.com", "2024-09-01-preview")
+    second = pipecat_bot._get_azure_openai_client("key", "https://test.com", "2024-09-01-preview")
+
+    assert first is second
+
+
+@pytest.mark.asyncio
+async def test_azure_openai_client_separate_for_different_settings(shared_clients):
+    """Test different endpoints get their own client"""
+    first = pipecat_bot._get_azure_openai_client("key", "https://one.com", "2024-09-01-preview")
+    second = pipecat_bot._get_azure_openai_client("key", "https://two.com", "2024-09-01-preview")
+
+    assert first is not second
+
+
+@pytest.mark.asyncio
+async def test_shared_client_llm_service_uses_shared_client(shared_clients):
+    """Test the LLM service subclass picks up the shared client"""
+    llm = pipecat_bot._SharedClientAzureLLMService(
+        api_key="key",
+        endpoint="https://test.com",
+        model="test-deployment",
+    )
+
+    assert llm._client is pipecat_bot._get_azure_openai_client(
+        "key", "https://test.com", "2024-09-01-preview"
+    )
+
+
+@pytest.mark.asyncio
+async def test_close_shared_clients_closes_and_clears(shared_clients):
+    """Test shutdown closes clients and empties the registry"""
+    client = pipecat_bot._get_azure_openai_client("key", "https://test.com", "2024-09-01-preview")
+
+    with patch.object(client, "close", new_callable=AsyncMock) as mock_close:
+        await pipecat_bot.close_shared_clients()
+
+    mock_close.assert_awaited_once()
+    assert shared_clients == {}
+
+
+@pytest.fixture
+def shared_http_session():
+    """Isolate the shared ElevenLabs HTTP session for each test."""
+    pipecat_bot._elevenlabs_http_session = None
+    yield
+    pipecat_bot._elevenlabs_http_session = None
+
+
+@pytest.mark.asyncio
+async def test_elevenlabs_http_session_reused(shared_http_session):
+    """Test sessions on the same event loop share one aiohttp session"""
+    session = pipecat_bot._get_elevenlabs_http_session()
+    try:
+        assert pipecat_bot._get_elevenlabs_http_session() is session
+    finally:
+        await session.close()
+
+
+@pytest.mark.asyncio
+async def test_close_shared_clients_closes_http_session(shared_clients, shared_http_session):
+    """Test shutdown closes the ElevenLabs HTTP session"""
+    session = pipecat_bot._get_elevenlabs_http_session()
+
+    await pipecat_bot.close_shared_clients()
+
+    assert session.closed
+    assert pipecat_bot._elevenlabs_http_session is None
+
+
+# ============================================================================
+# Shared Pipeline Runner Tests
+# ============================================================================
+
+@pytest.mark.asyncio
+async def test_pipeline_runner_shared_across_sessions():
+    """Test sessions on the same event loop reuse one runner"""
+    assert pipecat_bot._get_runner() is pipecat_bot._get_runner()
+
+
+@pytest.mark.asyncio
+async def test_pipeline_runner_does_not_take_over_sigint():
+    """Test the shared runner leaves SIGINT handling to the application server"""
+    with patch("src.voice_pipeline.pipecat_bot.PipelineRunner") as mock_runner_class:
+        pipecat_bot._runner = None
+        pipecat_bot._get_runner()
+
+    mock_runner_class.assert_called_once_with(handle_sigint=False)
+    pipecat_bot._runner = None
+
+
+# ============================================================================
+# Message Writer
+# ============================================================================
+
+@pytest.mark.asyncio
+async def test_message_writer_batches_queued_messages():
+    """Test messages queued together are saved in one batch, in order"""
+    from uuid import uuid4
+    from src.models.conversation_message import MessageRole
+
+    conversation_id = uuid4()
+    with patch(
+        "src.voice_pipeline.pipecat_bot._save_messages_async", new_callable=AsyncMock
+    ) as mock_save:
+        writer = pipecat_bot._MessageWriter(conversation_id)
+        writer.enqueue(MessageRole.USER, "Xin chào")
+        writer.enqueue(MessageRole.ASSISTANT, "Chào bạn")
+        await writer.close()
+
+    mock_save.assert_awaited_once()
+    saved_id, batch = mock_save.await_args.args
+    assert saved_id == conversation_id
+    assert [(role, content) for role, content, _, _ in batch] == [
+        (MessageRole.USER, "Xin chào"),
+        (MessageRole.ASSISTANT, "Chào bạn"),
+    ]
+    assert batch[0][2] <= batch[1][2]
+
+
+@pytest.mark.asyncio
+async def test_message_writer_close_flushes_pending_messages():
+    """Test close() saves messages queued after the writer went idle"""
+    from uuid import uuid4
+    from src.models.conversation_message import MessageRole
+
+    with patch(
+        "src.voice_pipeline.pipecat_bot._save_messages_async", new_callable=AsyncMock
+    ) as mock_save:
+        writer = pipecat_bot._MessageWriter(uuid4())
+        writer.enqueue(MessageRole.USER, "first")
+        await asyncio.sleep(0)
+        writer.enqueue(MessageRole.ASSISTANT, "second")
+        await writer.close()
+
+    saved = [content for call in mock_save.await_args_list for _, content, _, _ in call.args[1]]
+    assert saved == ["first", "second"]
+
+
+@pytest.mark.asyncio
+async def test_save_messages_runs_on_dedicated_db_threads():
+    """Test message saves run on the msg-db executor, not the default pool"""
+    import threading
+    from datetime import datetime, timezone
+    from uuid import uuid4
+    from src.models.conversation_message import MessageRole
+
+    thread_names = []
+
+    def fake_session():
+        thread_names.append(threading.current_thread().name)
+        return MagicMock()
+
+    with patch("src.voice_pipeline.pipecat_bot.SessionLocal", side_effect=fake_session):
+        await pipecat_bot._save_messages_async(
+            uuid4(), [(MessageRole.USER, "hello", datetime.now(timezone.utc), None)]
+        )
+
+    assert len(thread_names) == 1
+    assert thread_names[0].startswith("msg-db")
+
+
+@pytest.mark.asyncio
+async def test_save_messages_uses_one_insert_and_commit_per_batch():
+    """Test a batch is written as one multi-row INSERT in one transaction"""
+    from datetime import datetime, timezone
+    from uuid import uuid4
+    from src.models.conversation_message import MessageRole
+
+    conversation_id = uuid4()
+    now = datetime.now(timezone.utc)
+    batch = [
+        (MessageRole.USER, "hello", now, None),
+        (MessageRole.ASSISTANT, "hi there", now, {"function_calls": ["calculate_life_path"]}),
+    ]
+
+    mock_session = MagicMock()
+    with patch("src.voice_pipeline.pipecat_bot.SessionLocal") as mock_session_local:
+        mock_session_local.return_value.__enter__.return_value = mock_session
+        await pipecat_bot._save_messages_async(conversation_id, batch)
+
+    mock_session.execute.assert_called_once()
+    rows = mock_session.execute.call_args.args[1]
+    assert [row["content"] for row in rows] == ["hello", "hi there"]
+    assert all(row["conversation_id"] == conversation_id for row in rows)
+    assert rows[0]["message_metadata"] == {}
+    mock_session.commit.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_is_retried_row_by_row():
+    """Test one bad row in a batch does not lose the other messages"""
+    from datetime import datetime, timezone
+    from uuid import uuid4
+    from src.models.conversation_message import MessageRole
+
+    now = datetime.now(timezone.utc)
+    batch = [
+        (MessageRole.USER, "hello", now, None),
+        (MessageRole.ASSISTANT, "bad row", now, None),
+        (MessageRole.USER, "what is my number?", now, None),
+    ]
+    saved = []
+
+    def fake_execute(statement, rows):
+        if any(row["content"] == "bad row" for row in rows):
+            raise RuntimeError("value too long")
+        saved.extend(row["content"] for row in rows)
+
+    mock_session = MagicMock()
+    mock_session.execute.side_effect = fake_execute
+    with patch("src.voice_pipeline.pipecat_bot.SessionLocal") as mock_session_local, \
+            patch("src.voice_pipeline.pipecat_bot.logger") as mock_logger:
+        mock_session_local.return_value.__enter__.return_value = mock_session
+        await pipecat_bot._save_messages_async(uuid4(), batch)
+
+    assert saved == ["hello", "what is my number?"]
+    # Batch attempt plus one transaction per row
+    assert mock_session.execute.call_count == 4
+    assert mock_session.commit.call_count == 2
+    # Only the bad row is reported as lost
+    mock_logger.error.assert_called_once()
+    assert mock_logger.error.call_args.kwargs["extra"]["message_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_repeated_save_failures_log_traceback_once():
+    """Test only the first of a burst of save failures logs a traceback"""
+    from datetime import datetime, timezone
+    from uuid import uuid4
+    from src.models.conversation_message import MessageRole
+
+    batch = [(MessageRole.USER, "hello", datetime.now(timezone.utc), None)]
+
+    with patch("src.voice_pipeline.pipecat_bot.SessionLocal", side_effect=RuntimeError("db down")), \
+            patch("src.voice_pipeline.pipecat_bot._last_save_traceback", float("-inf")), \
+            patch("src.voice_pipeline.pipecat_bot.logger") as mock_logger:
+        await pipecat_bot._save_messages_async(uuid4(), batch)
+        await pipecat_bot._save_messages_async(uuid4(), batch)
+
+    assert [call.kwargs["exc_info"] for call in mock_logger.error.call_args_list] == [True, False]
+
+
+@pytest.mark.asyncio
+async def test_message_writer_queues_transcript_updates():
+    """Test transcript updates are queued with their role, skipping empty text"""
+    from uuid import uuid4
+    from pipecat.frames.frames import TranscriptionMessage, TranscriptionUpdateFrame
+    from src.models.conversation_message import MessageRole
+
+    frame = TranscriptionUpdateFrame(messages=[
+        TranscriptionMessage(role="user", content="Số đường đời của tôi là gì?"),
+        TranscriptionMessage(role="assistant", content=""),
+        TranscriptionMessage(role="assistant", content="Số đường đời của bạn là 7."),
+    ])
+
+    with patch(
+        "src.voice_pipeline.pipecat_bot._save_messages_async", new_callable=AsyncMock
+    ) as mock_save:
+        writer = pipecat_bot._MessageWriter(uuid4())
+        await writer.on_transcript_update(Mock(), frame)
+        await writer.close()
+
+    saved = [(role, content) for call in mock_save.await_args_list for role, content, _, _ in call.args[1]]
+    assert saved == [
+        (MessageRole.USER, "Số đường đời của tôi là gì?"),
+        (MessageRole.ASSISTANT, "Số đường đời của bạn là 7."),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_message_writer_drops_messages_when_queue_full():
+    """Test enqueue never blocks the pipeline when the save queue is full"""
+    from uuid import uuid4
+    from src.models.conversation_message import MessageRole
+
+    with patch(
+        "src.voice_pipeline.pipecat_bot._save_messages_async", new_callable=AsyncMock
+    ) as mock_save, patch("src.voice_pipeline.pipecat_bot._SAVE_QUEUE_SIZE", 2), \
+            patch("src.voice_pipeline.pipecat_bot.logger") as mock_logger:
+        writer = pipecat_bot._MessageWriter(uuid4())
+        for text in ("one", "two", "three"):
+            writer.enqueue(MessageRole.USER, text)
+        await writer.close()
+
+    mock_logger.warning.assert_called_once()
+    saved = [content for call in mock_save.await_args_list for _, content, _, _ in call.args[1]]
+    assert saved == ["one", "two"]
+
+
 # ============================================================================
 # Module Import Test
 # ============================================================================
@@ -156,6 +721,11 @@ def test_pipecat_bot_error_exception_exists():
     assert issubclass(pipecat_bot.PipecatBotError, Exception)
 
 
+def test_configuration_error_is_value_error():
+    """Test that ConfigurationError stays catchable as ValueError"""
+    assert issubclass(pipecat_bot.ConfigurationError, ValueError)
+
+
 def test_pipecat_bot_error_can_be_raised():
     """Test that PipecatBotError can be instantiated and raised"""
     with pytest.raises(pipecat_bot.PipecatBotError):
@@ -7,12 +7,25 @@ from unittest.mock import Mock, patch
 from datetime import datetime, timezone
 
 from src.voice_pipeline.system_prompts import (
+    _get_encoding,
+    clear_system_prompt_cache,
     count_tokens,
     format_conversation_history,
-    get_numerology_system_prompt
+    get_numerology_system_prompt,
+    truncate_to_tokens
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_prompt_cache():
+    """Start every test with no memoized prompts or encodings (tests patch both)."""
+    clear_system_prompt_cache()
+    _get_encoding.cache_clear()
+    yield
+    clear_system_prompt_cache()
+    _get_encoding.cache_clear()
+
+
 class TestCountTokens:
     """Test suite for count_tokens function."""
 
@@ -30,6 +43,19 @@ class TestCountTokens:
             assert result == 6
             mock_tiktoken.encoding_for_model.assert_called_once_with("gpt-4")
 
+    def test_encoding_resolved_once_across_calls(self):
+        """Test that the encoding is looked up once and reused for later counts."""
+        with patch('src.voice_pipeline.system_prompts.tiktoken') as mock_tiktoken:
+            mock_encoding = Mock()
+            mock_encoding.encode.return_value = [1, 2, 3]
+            mock_tiktoken.encoding_for_model.return_value = mock_encoding
+
+            assert count_tokens("first") == 3
+            assert count_tokens("second") == 3
+
+            mock_tiktoken.encoding_for_model.assert_called_once_with("gpt-4")
+            assert mock_encoding.encode.call_count == 2
+
     def test_estimates_tokens_when_tiktoken_unavailable(self):
         """Test that tokens are estimated when tiktoken is not available."""
         text = "Hello, this is a test message."  # 30 chars
@@ -53,6 +79,59 @@ class TestCountTokens:
             assert result == len(text) // 4
 
 
+class TestTruncateToTokens:
+    """Test suite for truncate_to_tokens function."""
+
+    def test_returns_short_text_unchanged(self):
+        """Test that text with no more UTF-8 bytes than the budget is returned without encoding."""
+        with patch('src.voice_pipeline.system_prompts.tiktoken') as mock_tiktoken:
+            assert truncate_to_tokens("short", 5) == "short"
+            mock_tiktoken.encoding_for_model.assert_not_called()
+
+    def test_short_multibyte_text_is_cut_to_budget(self):
+        """Test that few characters of dense text are still encoded and cut to fit."""
+        with patch('src.voice_pipeline.system_prompts.tiktoken') as mock_tiktoken:
+            # Byte-level encoding: one token per UTF-8 byte
+            mock_encoding = Mock()
+            mock_encoding.encode.side_effect = lambda text: list(text.encode("utf-8"))
+            mock_encoding.decode.side_effect = lambda tokens: bytes(tokens).decode("utf-8", errors="replace")
+            mock_tiktoken.encoding_for_model.return_value = mock_encoding
+
+            # 3 characters, 9 bytes/tokens
+            result = truncate_to_tokens("ệệệ", 5)
+
+        assert result == "ệ"
+        assert len(mock_encoding.encode(result)) <= 5
+
+    def test_cuts_on_token_boundary(self):
+        """Test that long text is cut to the first max_tokens tokens."""
+        with patch('src.voice_pipeline.system_prompts.tiktoken') as mock_tiktoken:
+            mock_encoding = Mock()
+            mock_encoding.encode.return_value = list(range(20))
+            mock_encoding.decode.side_effect = lambda tokens: "x" * len(tokens)
+            mock_tiktoken.encoding_for_model.return_value = mock_encoding
+
+            result = truncate_to_tokens("y" * 50, 5)
+
+        assert result == "xxxxx"
+        mock_encoding.decode.assert_called_once_with([0, 1, 2, 3, 4])
+
+    def test_drops_partial_trailing_character(self):
+        """Test that a cut inside a multi-byte character does not leave U+FFFD."""
+        with patch('src.voice_pipeline.system_prompts.tiktoken') as mock_tiktoken:
+            mock_encoding = Mock()
+            mock_encoding.encode.return_value = list(range(20))
+            mock_encoding.decode.return_value = "Số đường đ\ufffd"
+            mock_tiktoken.encoding_for_model.return_value = mock_encoding
+
+            assert truncate_to_tokens("Số đường đời " * 5, 5) == "Số đường đ"
+
+    def test_estimates_when_tiktoken_unavailable(self):
+        """Test that ~4 chars per token are kept when tiktoken is not available."""
+        with patch('src.voice_pipeline.system_prompts.tiktoken', None):
+            assert truncate_to_tokens("A" * 100, 10) == "A" * 40
+
+
 class TestFormatConversationHistory:
     """Test suite for format_conversation_history function."""
 
@@ -113,6 +192,73 @@ class TestFormatConversationHistory:
         assert "Test Topic" in result
         # Should not crash, should handle gracefully
 
+    def test_keeps_most_conversations_that_fit_token_limit(self):
+        """Test that the largest leading subset within max_tokens is kept."""
+        conversations = [
+            {
+                "date": "2025-11-23T10:30:00Z",
+                "topic": f"Topic {i}",
+                "insights": "B" * 8,  # within the insight floor, never cut
+                "numbers": "7"
+            }
+            for i in range(10)
+        ]
+
+        with patch('src.voice_pipeline.system_prompts.tiktoken', None):
+            full = format_conversation_history(conversations, max_tokens=10_000)
+            lines = full.split("\n")
+            # Budget that fits exactly the header plus the first four entries
+            budget = len("\n".join(lines[:5])) // 4
+
+            result = format_conversation_history(conversations, max_tokens=budget)
+
+        assert result == "\n".join(lines[:5])
+
+    def test_counts_each_conversation_once_when_reducing(self):
+        """Test that reducing does not re-encode the joined history per attempt."""
+        conversations = [
+            {"date": "2025-11-23T10:30:00Z", "topic": f"Topic {i} of the series", "insights": "D" * 8}
+            for i in range(20)
+        ]
+
+        with patch('src.voice_pipeline.system_prompts.tiktoken') as mock_tiktoken:
+            mock_encoding = Mock()
+            mock_encoding.encode.side_effect = lambda text: [0] * len(text.split())
+            mock_tiktoken.encoding_for_model.return_value = mock_encoding
+
+            result = format_conversation_history(conversations, max_tokens=30)
+
+        assert result.startswith("Previous conversations with this user:")
+        assert "Topic 19 " not in result
+        # Full text, header, separator, one per conversation, one confirmation
+        assert mock_encoding.encode.call_count == len(conversations) + 4
+
+    def test_insights_share_token_budget_across_conversations(self):
+        """Test that insights are cut to their token share when there are many conversations."""
+        conversations = [
+            {"date": "2025-11-23T10:30:00Z", "topic": f"Topic {i}", "insights": "E" * 100}
+            for i in range(5)
+        ]
+
+        with patch('src.voice_pipeline.system_prompts.tiktoken', None):
+            # 400 // (5 * 4) = 20 tokens per insight, ~80 chars by estimation
+            result = format_conversation_history(conversations, max_tokens=400)
+
+        assert "Key insight: " + "E" * 80 + "\n" in result + "\n"
+        assert "E" * 81 not in result
+
+    def test_returns_minimal_context_when_nothing_fits(self):
+        """Test that a summary line is returned when no conversation fits."""
+        conversations = [
+            {"date": "2025-11-23T10:30:00Z", "topic": "Topic", "insights": "C" * 100}
+            for _ in range(3)
+        ]
+
+        with patch('src.voice_pipeline.system_prompts.tiktoken', None):
+            result = format_conversation_history(conversations, max_tokens=5)
+
+        assert result == "User has 3 previous conversations about numerology."
+
 
 class TestGetNumerologySystemPrompt:
     """Test suite for get_numerology_system_prompt function."""
@@ -193,3 +339,66 @@ class TestGetNumerologySystemPrompt:
             # Should return fallback prompt
             assert "Aria" in result  # Fallback contains "Aria"
             assert "Thần Số Học" in result  # Vietnamese content
+
+    def test_history_guidance_addresses_user_by_name(self):
+        """Test that the history guidance is personalized, not left as a placeholder."""
+        mock_user = Mock()
+        mock_user.full_name = "Minh"
+        mock_user.birth_date = None
+
+        with patch('src.voice_pipeline.system_prompts.PROMPT_TEMPLATE_PATH') as mock_path:
+            mock_path.read_text.return_value = "Hello {user_name}"
+
+            result = get_numerology_system_prompt(mock_user, conversation_history="History")
+
+        assert result.startswith("Hello Minh\n\nHistory\n\n")
+        assert "Chào Minh!" in result
+        assert "{user_name}" not in result
+
+    def test_repeat_calls_for_same_user_reuse_rendered_prompt(self):
+        """Test that the template is read once per user across sessions."""
+        mock_user = Mock()
+        mock_user.full_name = "Test User"
+        mock_user.birth_date = datetime(1990, 5, 15)
+
+        with patch('src.voice_pipeline.system_prompts.PROMPT_TEMPLATE_PATH') as mock_path:
+            mock_path.read_text.return_value = "Hello {user_name}"
+
+            first = get_numerology_system_prompt(mock_user)
+            second = get_numerology_system_prompt(mock_user, conversation_history="History")
+
+            assert first == "Hello Test User"
+            assert second.startswith("Hello Test User")
+            assert "History" in second
+            mock_path.read_text.assert_called_once()
+
+    def test_profile_change_renders_new_prompt(self):
+        """Test that a changed name is not served from the cache."""
+        mock_user = Mock()
+        mock_user.full_name = "Test User"
+        mock_user.birth_date = datetime(1990, 5, 15)
+
+        with patch('src.voice_pipeline.system_prompts.PROMPT_TEMPLATE_PATH') as mock_path:
+            mock_path.read_text.return_value = "Hello {user_name}"
+
+            get_numerology_system_prompt(mock_user)
+            mock_user.full_name = "Renamed User"
+            result = get_numerology_system_prompt(mock_user)
+
+            assert result == "Hello Renamed User"
+
+    def test_template_read_once_across_different_users(self):
+        """Test that the template file is read once per process, not per user."""
+        first_user = Mock()
+        first_user.full_name = "First User"
+        first_user.birth_date = None
+        second_user = Mock()
+        second_user.full_name = "Second User"
+        second_user.birth_date = None
+
+        with patch('src.voice_pipeline.system_prompts.PROMPT_TEMPLATE_PATH') as mock_path:
+            mock_path.read_text.return_value = "Hello {user_name}"
+
+            assert get_numerology_system_prompt(first_user) == "Hello First User"
+            assert get_numerology_system_prompt(second_user) == "Hello Second User"
+            mock_path.read_text.assert_called_once()